@@ -92,7 +92,12 @@ def run_single_environment_test(
 
 
 def run_all_environments_test(
-    runner: PerformanceTestRunner, environments: Optional[List[str]], iterations: int, warmup: bool, save_results: bool
+    runner: PerformanceTestRunner,
+    environments: Optional[List[str]],
+    iterations: int,
+    warmup: bool,
+    save_results: bool,
+    parallel: bool = False,
 ) -> dict:
     """Run performance tests for all environments.
 
@@ -102,6 +107,7 @@ def run_all_environments_test(
         iterations: Number of test iterations
         warmup: Whether to include warmup iteration
         save_results: Whether to save results to file
+        parallel: Whether to test environments concurrently
 
     Returns:
         Combined test results dictionary
@@ -115,7 +121,7 @@ def run_all_environments_test(
         runner.configure_test(test_iterations=iterations, warmup_iterations=1 if warmup else 0)
 
         # Run tests
-        results = runner.run_all_environments_test(environment_filter=environments)
+        results = runner.run_all_environments_test(environment_filter=environments, parallel=parallel)
 
         # Display summary
         summary = results["summary"]
@@ -234,7 +240,12 @@ Examples:
         "--iterations", type=int, default=2, help="Number of test iterations per environment (default: 2)"
     )
     parser.add_argument("--warmup", action="store_true", help="Include warmup iteration")
+    parser.add_argument("--parallel", action="store_true", help="Test multiple environments concurrently")
+    parser.add_argument(
+        "--max-parallel", type=int, help="Maximum environments tested at once with --parallel (default: half the CPUs)"
+    )
     parser.add_argument("--save", action="store_true", help="Save results to file")
+    parser.add_argument("--pretty-json", action="store_true", help="Indent saved result files for reading")
     parser.add_argument("--timeout", type=int, default=300, help="Startup timeout in seconds (default: 300)")
     parser.add_argument("--cooldown", type=int, default=10, help="Cooldown time between tests in seconds (default: 10)")
     parser.add_argument("--output-dir", type=str, help="Output directory for results")
@@ -264,41 +275,43 @@ Examples:
         if test_manager.list_environments():
             environments_dir = "environments/test-data"
 
-    runner = PerformanceTestRunner(project_root, output_dir, environments_dir)
-
-    # Configure test parameters
-    runner.configure_test(startup_timeout=args.timeout, cooldown_time=args.cooldown)
-
-    print("Container Performance Test Runner")
-    print(f"Project: {project_root}")
-    print(f"Output: {runner.output_dir}")
-
-    try:
-        # Handle different test modes
-        if args.report:
-            generate_performance_report(runner)
-        elif args.environment:
-            run_single_environment_test(runner, args.environment, args.iterations, args.warmup, args.save)
-        elif args.environments:
-            run_all_environments_test(runner, args.environments, args.iterations, args.warmup, args.save)
-        elif args.all:
-            run_all_environments_test(runner, None, args.iterations, args.warmup, args.save)
-
-        # Generate report if requested
-        if args.save and not args.report:
-            generate_performance_report(runner)
-
-    except KeyboardInterrupt:
-        print("\n❌ Test interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Test runner error: {e}")
-        print(f"❌ Test runner failed: {e}")
-        sys.exit(1)
-    finally:
-        # Ensure monitoring is stopped
-        runner.event_monitor.stop_monitoring()
-        runner.health_watcher.stop_monitoring()
+    # Leaving the block stops monitoring and releases the Docker client
+    with PerformanceTestRunner(project_root, output_dir, environments_dir) as runner:
+        # Configure test parameters
+        runner.configure_test(startup_timeout=args.timeout, cooldown_time=args.cooldown)
+        if args.pretty_json:
+            runner.configure_test(pretty_json=True)
+        if args.max_parallel:
+            runner.configure_test(max_parallel_envs=args.max_parallel)
+
+        print("Container Performance Test Runner")
+        print(f"Project: {project_root}")
+        print(f"Output: {runner.output_dir}")
+
+        try:
+            # Handle different test modes
+            if args.report:
+                generate_performance_report(runner)
+            elif args.environment:
+                run_single_environment_test(runner, args.environment, args.iterations, args.warmup, args.save)
+            elif args.environments:
+                run_all_environments_test(
+                    runner, args.environments, args.iterations, args.warmup, args.save, parallel=args.parallel
+                )
+            elif args.all:
+                run_all_environments_test(runner, None, args.iterations, args.warmup, args.save, parallel=args.parallel)
+
+            # Generate report if requested
+            if args.save and not args.report:
+                generate_performance_report(runner)
+
+        except KeyboardInterrupt:
+            print("\n❌ Test interrupted by user")
+            sys.exit(1)
+        except Exception as e:
+            logger.error(f"Test runner error: {e}")
+            print(f"❌ Test runner failed: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
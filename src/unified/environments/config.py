@@ -11,6 +11,11 @@ from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment, unused-ignore]
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,7 +145,8 @@ class EnvironmentConfig:
         """
         try:
             with compose_file.open() as f:
-                compose_config = yaml.safe_load(f)
+                # The libyaml loader is much faster than the pure-Python one when available
+                compose_config = yaml.load(f, Loader=_YamlLoader)
 
             logger.debug(f"Parsed compose configuration from {compose_file}")
             return compose_config
@@ -6,9 +6,10 @@ Supports both production and test environment directory structures.
 """
 
 import logging
+import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .config import EnvironmentConfig
 
@@ -30,23 +31,35 @@ class UnifiedEnvironmentManager:
         self.config = EnvironmentConfig(project_dir)
         self.active_environments: Dict[str, Dict[str, Any]] = {}
 
+        # (directory mtimes, environment names) from the last environments directory scan
+        self._envs_cache: Optional[Tuple[Tuple[Tuple[str, int], ...], List[str]]] = None
+
     def list_environments(self) -> List[str]:
         """List all available environments.
 
         Returns:
             List of environment names
         """
-        if not self.environments_dir.exists():
+        try:
+            with os.scandir(self.environments_dir) as entries:
+                env_dirs = [entry for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
             return []
 
+        # Adding or removing an environment, or its .env file, changes one of these mtimes
+        mtimes = tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in env_dirs))
+        if self._envs_cache is not None and self._envs_cache[0] == mtimes:
+            return list(self._envs_cache[1])
+
         environments = []
-        for env_dir in self.environments_dir.iterdir():
-            if env_dir.is_dir():
-                # Skip directories that don't contain environment files
-                if self._has_environment_files(env_dir):
-                    environments.append(env_dir.name)
+        for env_dir in env_dirs:
+            # Skip directories that don't contain environment files
+            if self._has_environment_files(Path(env_dir.path)):
+                environments.append(env_dir.name)
 
-        return sorted(environments)
+        environments.sort()
+        self._envs_cache = (mtimes, environments)
+        return list(environments)
 
     def _has_environment_files(self, env_dir: Path) -> bool:
         """Check if directory contains environment files.
@@ -411,6 +424,61 @@ class UnifiedEnvironmentManager:
             logger.error(f"Error removing containers for environment '{environment}': {e}")
             return {"success": False, "message": f"Error removing containers for environment '{environment}': {e}"}
 
+    def teardown(self, environment: str, remove_volumes: bool = True, timeout: int = 10) -> Dict[str, Any]:
+        """Stop and remove an environment's containers with a single ``docker compose down``.
+
+        Args:
+            environment: Name of the environment to tear down
+            remove_volumes: Whether to remove volumes
+            timeout: Seconds to wait for each container to stop before it is killed
+
+        Returns:
+            Dictionary with success status and message
+        """
+        logger.info(f"Tearing down environment '{environment}' (remove_volumes={remove_volumes})")
+
+        files = self.get_environment_files(environment)
+
+        if not files["env_file"]:
+            return {"success": False, "message": f"Environment '{environment}' files not found"}
+
+        try:
+            # Build the docker-compose command
+            cmd = ["docker", "compose"]
+
+            # Add env file
+            cmd.extend(["--env-file", str(files["env_file"].resolve())])
+
+            # Add compose files - always start with base, then add environment-specific overrides
+            default_compose = self.project_dir / "docker-compose.yml"
+            if default_compose.exists():
+                cmd.extend(["-f", str(default_compose.resolve())])
+
+            # Add environment-specific compose file as override if it exists
+            if files["compose_file"]:
+                cmd.extend(["-f", str(files["compose_file"].resolve())])
+
+            # Stop and remove in one go
+            cmd.extend(["down", "--remove-orphans", "--timeout", str(timeout)])
+            if remove_volumes:
+                cmd.append("--volumes")
+
+            # Execute command from environment directory
+            env_dir = files["env_dir"]
+            if env_dir is None:
+                raise ValueError(f"Environment directory not found for {environment}")
+            result = subprocess.run(cmd, cwd=str(env_dir.resolve()), capture_output=True, text=True, timeout=120)
+
+            if result.returncode == 0:
+                logger.info(f"Environment '{environment}' torn down successfully")
+                return {"success": True, "message": f"Environment '{environment}' torn down successfully"}
+            logger.error(f"Failed to tear down environment '{environment}': {result.stderr}")
+            return {"success": False, "message": f"Failed to tear down environment '{environment}': {result.stderr}"}
+
+        except Exception as e:
+            logger.error(f"Error tearing down environment '{environment}': {e}")
+            return {"success": False, "message": f"Error tearing down environment '{environment}': {e}"}
+
     def collect_container_logs(self, environment: str) -> Dict[str, Any]:
         """Collect logs from all containers in an environment.
 
@@ -493,11 +493,11 @@ class NetworkInfo:
         result = {"port": port, "accessible": False, "response_time": None, "error": None}
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             with socket.create_connection((host, port), timeout=timeout):
                 result["accessible"] = True
-                result["response_time"] = time.time() - start_time
+                result["response_time"] = time.perf_counter() - start_time
 
         except Exception as e:
             result["error"] = str(e)
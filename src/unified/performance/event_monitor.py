@@ -7,11 +7,13 @@ analysis and optimization.
 
 import json
 import logging
+import re
 import subprocess
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +25,15 @@ class ContainerEvent:
         self.timestamp = datetime.now()
         self.action = event_data.get("Action", "")
         self.container_id = event_data.get("id", "")
-        self.container_name = event_data.get("Actor", {}).get("Attributes", {}).get("name", "")
-        self.image = event_data.get("Actor", {}).get("Attributes", {}).get("image", "")
+        attributes = event_data.get("Actor", {}).get("Attributes", {})
+        self.container_name = attributes.get("name", "")
+        self.image = attributes.get("image", "")
+        # Only set on health_status events
+        self.health_status = attributes.get("health_status", "")
+        if self.action.startswith("health_status:"):
+            # The Docker daemon reports health transitions as "health_status: healthy"
+            self.action, _, status = self.action.partition(":")
+            self.health_status = self.health_status or status.strip()
         self.raw_data = event_data
 
         # Parse event timestamp if available (prefer nanosecond precision)
@@ -69,6 +78,14 @@ class ContainerEventMonitor:
         # Track containers we're interested in
         self.tracked_containers: Set[str] = set()
 
+        # All filters compiled into one alternation so each event is matched with a single search
+        self._filter_pattern: Optional[re.Pattern] = None
+        self._compile_filters()
+
+        # Signalled whenever an event is stored so callers can wait on events instead of sleeping
+        self._event_received = threading.Condition()
+        self.last_event_time: Optional[float] = None  # time.monotonic() of the last stored event
+
         # Event type mapping
         self.lifecycle_events = {"create", "start", "restart", "stop", "kill", "die", "destroy", "health_status"}
 
@@ -80,6 +97,24 @@ class ContainerEventMonitor:
         """
         self.container_filters.append(container_name)
         self.tracked_containers.add(container_name)
+        self._compile_filters()
+
+    def set_container_filters(self, container_names: Iterable[str]) -> None:
+        """Replace all container name patterns to monitor.
+
+        Args:
+            container_names: Container names or patterns
+        """
+        self.container_filters[:] = container_names
+        self.tracked_containers = set(self.container_filters)
+        self._compile_filters()
+
+    def _compile_filters(self) -> None:
+        """Rebuild the matcher used to check event container names against the filters."""
+        if self.container_filters:
+            self._filter_pattern = re.compile("|".join(map(re.escape, self.container_filters)))
+        else:
+            self._filter_pattern = None
 
     def add_event_callback(self, callback: Callable[[ContainerEvent], None]) -> None:
         """Add a callback function for container events.
@@ -158,8 +193,8 @@ class ContainerEventMonitor:
                     if not line:
                         continue
 
-                    # Always store raw event for comprehensive logging
-                    if self.capture_all_events:
+                    # Store raw events for comprehensive logging (a filtered stream only carries our containers)
+                    if self.capture_all_events or self.container_filters:
                         self.all_events_log.append(line)
 
                     # Parse event JSON
@@ -193,9 +228,12 @@ class ContainerEventMonitor:
             event: The container event to process
         """
         # Store the event
-        self.events.append(event)
+        with self._event_received:
+            self.events.append(event)
+            self.last_event_time = time.monotonic()
+            self._event_received.notify_all()
 
-        logger.debug(f"Captured Docker event: {event.action} for {event.container_name} at {event.timestamp}")
+        logger.debug("Captured Docker event: %s for %s at %s", event.action, event.container_name, event.timestamp)
 
         # Call registered callbacks
         for callback in self.event_callbacks:
@@ -252,9 +290,7 @@ class ContainerEventMonitor:
             elif event.action == "start":
                 timeline["start"] = event.timestamp
             elif event.action == "health_status":
-                # Parse health status from attributes
-                attrs = event.raw_data.get("Actor", {}).get("Attributes", {})
-                health_status = attrs.get("health_status", "")
+                health_status = event.health_status
                 if health_status == "starting":
                     timeline["health_status_starting"] = event.timestamp
                 elif health_status == "healthy":
@@ -287,10 +323,53 @@ class ContainerEventMonitor:
 
         return None
 
+    def wait_for_events(self, container_names: Iterable[str], action: str = "create", timeout: float = 5.0) -> bool:
+        """Wait until an event with the given action has been seen for every container.
+
+        Args:
+            container_names: Names of the containers to wait for
+            action: Event action to wait for
+            timeout: Timeout in seconds
+
+        Returns:
+            True if all events arrived, False if timeout
+        """
+        pending = set(container_names)
+
+        def all_seen() -> bool:
+            pending.difference_update(event.container_name for event in self.events if event.action == action)
+            return not pending
+
+        with self._event_received:
+            return self._event_received.wait_for(all_seen, timeout)
+
+    def wait_for_idle(self, idle_time: float = 0.2, timeout: float = 2.0) -> bool:
+        """Wait until no event has been stored for ``idle_time`` seconds.
+
+        Args:
+            idle_time: Quiet period in seconds that counts as idle
+            timeout: Timeout in seconds
+
+        Returns:
+            True if the event stream went idle, False if timeout
+        """
+        deadline = time.monotonic() + timeout
+
+        with self._event_received:
+            while True:
+                now = time.monotonic()
+                quiet_for = idle_time if self.last_event_time is None else now - self.last_event_time
+                if quiet_for >= idle_time:
+                    return True
+                if now >= deadline:
+                    return False
+                self._event_received.wait(min(idle_time - quiet_for, deadline - now))
+
     def clear_events(self) -> None:
         """Clear all stored events."""
-        self.events.clear()
-        self.all_events_log.clear()
+        with self._event_received:
+            self.events.clear()
+            self.all_events_log.clear()
         logger.info("Cleared all stored events")
 
     def get_event_summary(self) -> Dict[str, Any]:
@@ -333,15 +412,11 @@ class ContainerEventMonitor:
             logger.debug(f"Excluding log collector container: {event.container_name}")
             return False
 
-        if not self.container_filters:
+        if self._filter_pattern is None:
             return True
 
-        # Check if the container name matches any of our filters
-        for container_filter in self.container_filters:
-            if container_filter in event.container_name:
-                return True
-
-        return False
+        # Check if the container name contains any of our filters
+        return self._filter_pattern.search(event.container_name) is not None
 
     def save_full_event_log(self, output_path: Path) -> Path:
         """Save the complete event log to a file.
@@ -354,25 +429,30 @@ class ContainerEventMonitor:
         """
         output_path = Path(output_path)
 
+        # Snapshot so the header counts match the body while the stream keeps appending
+        raw_events = self.all_events_log.copy()
+
         with open(output_path, "w") as f:
             # Write header
-            f.write("# Docker Events Log\n")
-            f.write(f"# Monitoring started: {datetime.now().isoformat()}\n")
-            f.write(f"# Capture all events: {self.capture_all_events}\n")
-            f.write(f"# Container filters: {self.container_filters}\n")
-            f.write(f"# Total raw events: {len(self.all_events_log)}\n")
-            f.write(f"# Total processed events: {len(self.events)}\n")
-            f.write("# ================================================================================\n\n")
-
-            # Write all raw events
-            for event_json in self.all_events_log:
-                f.write(f"{event_json}\n")
-
-        logger.info(f"Saved {len(self.all_events_log)} raw events to {output_path}")
+            f.write(
+                "# Docker Events Log\n"
+                f"# Monitoring started: {datetime.now().isoformat()}\n"
+                f"# Capture all events: {self.capture_all_events}\n"
+                f"# Container filters: {self.container_filters}\n"
+                f"# Total raw events: {len(raw_events)}\n"
+                f"# Total processed events: {len(self.events)}\n"
+                "# ================================================================================\n\n"
+            )
+
+            # Write all raw events, one JSON object per line
+            f.writelines(f"{event_json}\n" for event_json in raw_events)
+
+        logger.info(f"Saved {len(raw_events)} raw events to {output_path}")
         return output_path
 
     def clear_all_events(self) -> None:
         """Clear all stored events and raw event logs."""
-        self.events.clear()
-        self.all_events_log.clear()
+        with self._event_received:
+            self.events.clear()
+            self.all_events_log.clear()
         logger.debug("Cleared all stored events")
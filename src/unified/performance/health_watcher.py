@@ -23,6 +23,8 @@ class HealthStatus:
     UNHEALTHY = "unhealthy"
     NONE = "none"
 
+    __slots__ = ("container_name", "status", "timestamp")
+
     def __init__(self, container_name: str, status: str, timestamp: Optional[datetime] = None):
         self.container_name = container_name
         self.status = status
@@ -38,13 +40,24 @@ class HealthStatus:
 class HealthCheckWatcher:
     """Monitors Docker container health checks."""
 
-    def __init__(self, check_interval: float = 2.0):
+    def __init__(
+        self, check_interval: float = 2.0, docker_client: Optional[Any] = None, min_check_interval: float = 0.05
+    ):
         """Initialize health check watcher.
 
+        Polling starts every ``min_check_interval`` seconds and doubles up to
+        ``check_interval`` while nothing changes; any status change resets it.
+
         Args:
-            check_interval: Interval in seconds between health checks
+            check_interval: Maximum interval in seconds between health checks
+            docker_client: Docker Engine API client (``docker.APIClient``) reused for every
+                lookup instead of spawning the docker CLI; the CLI is used when not given
+            min_check_interval: Initial interval in seconds between health checks
         """
         self.check_interval = check_interval
+        self.min_check_interval = min_check_interval
+        self._backoff = min_check_interval
+        self.docker_client = docker_client
         self.monitored_containers: Dict[str, str] = {}  # container_name -> container_id
         self.health_history: List[HealthStatus] = []
         self.health_callbacks: List[Callable[[HealthStatus], None]] = []
@@ -54,6 +67,9 @@ class HealthCheckWatcher:
         # Track current health status for each container
         self.current_status: Dict[str, str] = {}
 
+        # Signalled on every status change so waiters wake immediately instead of polling
+        self._status_changed = threading.Condition()
+
     def add_container(self, container_name: str, container_id: Optional[str] = None) -> None:
         """Add a container to monitor.
 
@@ -66,6 +82,7 @@ class HealthCheckWatcher:
 
         if container_id:
             self.monitored_containers[container_name] = container_id
+            self._backoff = self.min_check_interval
             logger.info(f"Added container {container_name} ({container_id}) to health monitoring")
         else:
             logger.warning(f"Could not resolve container ID for {container_name}")
@@ -97,6 +114,7 @@ class HealthCheckWatcher:
             return
 
         self.monitoring = True
+        self._backoff = self.min_check_interval
         self.monitor_thread = threading.Thread(target=self._monitor_health, daemon=True)
         self.monitor_thread.start()
         logger.info("Started health check monitoring")
@@ -124,6 +142,10 @@ class HealthCheckWatcher:
             Container ID or None if not found
         """
         try:
+            if self.docker_client is not None:
+                containers = self.docker_client.containers(filters={"name": container_name}, quiet=True)
+                return containers[0]["Id"][:12] if containers else None
+
             result = subprocess.run(
                 ["docker", "ps", "-q", "--filter", f"name={container_name}"], capture_output=True, text=True, timeout=10
             )
@@ -142,24 +164,73 @@ class HealthCheckWatcher:
         """Monitor container health in a separate thread."""
         try:
             while self.monitoring:
-                # Check health status for all monitored containers
-                for container_name, container_id in self.monitored_containers.items():
-                    try:
-                        health_status = self._get_container_health(container_id)
+                # Check health status for all monitored containers with one batched lookup
+                try:
+                    statuses = self.poll_batch(dict(self.monitored_containers))
+                except Exception as e:
+                    logger.error(f"Error checking container health: {e}")
+                    statuses = {}
+
+                for container_name, health_status in statuses.items():
+                    # Check if status changed
+                    if health_status != self.current_status.get(container_name):
+                        self._process_health_change(container_name, health_status)
+
+                # Wait before next check, backing off while statuses are stable
+                time.sleep(self._backoff)
+                self._backoff = min(self.check_interval, self._backoff * 2)
 
-                        # Check if status changed
-                        current_status = self.current_status.get(container_name)
-                        if health_status != current_status:
-                            self._process_health_change(container_name, health_status)
+        except Exception as e:
+            logger.error(f"Error in health monitoring thread: {e}")
 
-                    except Exception as e:
-                        logger.error(f"Error checking health for {container_name}: {e}")
+    def poll_batch(self, containers: Dict[str, str]) -> Dict[str, str]:
+        """Get the health status of several containers with a single ``docker inspect``.
 
-                # Wait before next check
-                time.sleep(self.check_interval)
+        Args:
+            containers: Mapping of container names to container IDs
 
-        except Exception as e:
-            logger.error(f"Error in health monitoring thread: {e}")
+        Returns:
+            Dictionary mapping container names to health status strings
+        """
+        if not containers:
+            return {}
+
+        # The API client keeps one connection open, so per-container requests are already cheap
+        if self.docker_client is not None:
+            return {name: self._get_container_health(container_id) for name, container_id in containers.items()}
+
+        # Containers that cannot be inspected report no health, as with single lookups
+        statuses = dict.fromkeys(containers, HealthStatus.NONE)
+
+        try:
+            result = subprocess.run(
+                [
+                    "docker",
+                    "inspect",
+                    "--format",
+                    "{{.Id}} {{if .State.Health}}{{.State.Health.Status}}{{end}}",
+                    *containers.values(),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timeout getting health status for {len(containers)} containers")
+            return statuses
+
+        # docker inspect prints the containers it found even when others are missing
+        if result.returncode != 0:
+            logger.warning(f"Failed to get health status for some containers: {result.stderr.strip()}")
+
+        for line in result.stdout.splitlines():
+            full_id, _, status = line.partition(" ")
+            for name, container_id in containers.items():
+                if full_id.startswith(container_id):
+                    statuses[name] = status.strip() or HealthStatus.NONE
+                    break
+
+        return statuses
 
     def _get_container_health(self, container_id: str) -> str:
         """Get the health status of a container.
@@ -171,6 +242,10 @@ class HealthCheckWatcher:
             Health status string
         """
         try:
+            if self.docker_client is not None:
+                state = self.docker_client.inspect_container(container_id)["State"]
+                return state.get("Health", {}).get("Status") or HealthStatus.NONE
+
             result = subprocess.run(
                 ["docker", "inspect", container_id, "--format", "{{.State.Health.Status}}"],
                 capture_output=True,
@@ -200,13 +275,19 @@ class HealthCheckWatcher:
             container_name: Name of the container
             new_status: New health status
         """
-        # Update current status
-        old_status = self.current_status.get(container_name)
-        self.current_status[container_name] = new_status
+        with self._status_changed:
+            # Update current status
+            old_status = self.current_status.get(container_name)
+            self.current_status[container_name] = new_status
+
+            # Create health status record
+            health_status = HealthStatus(container_name, new_status)
+            self.health_history.append(health_status)
+
+            # Poll quickly again while containers are transitioning
+            self._backoff = self.min_check_interval
 
-        # Create health status record
-        health_status = HealthStatus(container_name, new_status)
-        self.health_history.append(health_status)
+            self._status_changed.notify_all()
 
         logger.info(f"Health status change: {container_name} {old_status} -> {new_status}")
 
@@ -217,6 +298,20 @@ class HealthCheckWatcher:
             except Exception as e:
                 logger.error(f"Error in health callback: {e}")
 
+    def update_status(self, container_name: str, status: str) -> None:
+        """Record a health status reported from outside the polling loop.
+
+        Used to feed Docker ``health_status`` events into the watcher so that
+        waiters are woken as soon as Docker reports a transition rather than on
+        the next poll.
+
+        Args:
+            container_name: Name of the container
+            status: Reported health status
+        """
+        if status and self.current_status.get(container_name) != status:
+            self._process_health_change(container_name, status)
+
     def get_health_history(self, container_name: str) -> List[HealthStatus]:
         """Get health history for a container.
 
@@ -249,14 +344,7 @@ class HealthCheckWatcher:
         Returns:
             True if container became healthy, False if timeout
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if self.get_current_status(container_name) == HealthStatus.HEALTHY:
-                return True
-            time.sleep(1.0)
-
-        return False
+        return self.wait_for_status(container_name, HealthStatus.HEALTHY, timeout)
 
     def wait_for_status(self, container_name: str, target_status: str, timeout: float = 120.0) -> bool:
         """Wait for a container to reach a specific status.
@@ -269,14 +357,10 @@ class HealthCheckWatcher:
         Returns:
             True if container reached target status, False if timeout
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if self.get_current_status(container_name) == target_status:
-                return True
-            time.sleep(1.0)
-
-        return False
+        with self._status_changed:
+            return self._status_changed.wait_for(
+                lambda: self.current_status.get(container_name) == target_status, timeout
+            )
 
     def calculate_time_to_healthy(self, container_name: str) -> Optional[float]:
         """Calculate time from starting to healthy for a container.
@@ -332,6 +416,7 @@ class HealthCheckWatcher:
 
     def clear_history(self) -> None:
         """Clear health history."""
-        self.health_history.clear()
-        self.current_status.clear()
+        with self._status_changed:
+            self.health_history.clear()
+            self.current_status.clear()
         logger.info("Cleared health history")
@@ -0,0 +1,107 @@
+"""JSON encoding and file helpers shared by the performance modules.
+
+orjson is used when it is installed; otherwise the standard library encoder
+produces the same documents.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# Bound once so the default hook skips the attribute lookup per datetime
+_isoformat = datetime.isoformat
+
+
+def json_default(obj: Any) -> str:
+    """Encode values the JSON encoder does not support natively.
+
+    Args:
+        obj: Value the encoder could not serialize
+
+    Returns:
+        ISO 8601 string for datetime objects, the path string for paths
+
+    Raises:
+        TypeError: If the value is neither a datetime nor a path
+    """
+    if isinstance(obj, datetime):
+        return _isoformat(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON.
+
+    Datetimes and paths are converted by the encoder as it reaches them instead of
+    copying the tree first. Non-ASCII characters are kept as UTF-8 by both encoders.
+
+    Args:
+        data: Data to serialize
+        pretty: Indent with two spaces; compact output is smaller and faster to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if pretty else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=json_default, option=option)
+
+    return json.dumps(data, indent=2 if pretty else None, default=json_default, ensure_ascii=False).encode()
+
+
+def write_json(path: Path, data: Any, pretty: bool = False, atomic: bool = True) -> None:
+    """Write data as JSON with a single write.
+
+    Args:
+        path: Output file path
+        data: Data to serialize
+        pretty: Indent the output for reading
+        atomic: Write next to the destination and move the file into place, so a
+            crash never leaves a truncated file behind
+    """
+    payload = dumps(data, pretty)
+    if not atomic:
+        path.write_bytes(payload)
+        return
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def append_json_line(path: Path, data: Any) -> None:
+    """Append data as one compact JSON line.
+
+    Args:
+        path: NDJSON file path
+        data: Data to serialize
+    """
+    with open(path, "ab") as f:
+        f.write(dumps(data) + b"\n")
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f:
+        payload = f.read()
+
+    if orjson is not None:
+        return orjson.loads(payload)
+
+    return json.loads(payload)
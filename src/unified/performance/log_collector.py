@@ -4,21 +4,65 @@ This module provides functionality to collect logs from Docker containers
 during performance testing for comprehensive debugging and analysis.
 """
 
+import json
 import logging
+import os
+import re
 import subprocess
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import DefaultDict, Dict, List, Optional, Any, Tuple
+
+try:
+    import docker
+except ImportError:  # pragma: no cover - optional dependency
+    docker = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - optional dependency
+    zstd = None  # type: ignore[assignment, unused-ignore]
 
 logger = logging.getLogger(__name__)
 
+# Header written at the top of every collected container log file
+_LOG_HEADER_TEMPLATE = (
+    "# Container Log Collection\n"
+    "# Container: {name}\n"
+    "# Collection Time: {timestamp}\n"
+    "# Command: {command}\n"
+    "# Exit Code: {exit_code}\n"
+    "# " + "=" * 80 + "\n\n"
+)
+
+# One line of ``docker compose logs --no-color`` output: padded container name, "| ", message
+_COMPOSE_LOG_LINE = re.compile(r"^(\S+?) *\| (.*\n?)", re.MULTILINE)
+
 
 class ContainerLogCollector:
     """Collects logs from Docker containers for performance analysis."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, compress_logs: bool = True, docker_client: Optional[Any] = None):
         """Initialize container log collector.
 
+        Args:
+            output_dir: Directory to save container logs
+            compress_logs: Write container logs as ``.log.zst`` when zstandard is installed
+            docker_client: Docker Engine API client (``docker.APIClient``) used for per-container
+                inspect and logs calls instead of spawning the docker CLI
+        """
+        self.compress_logs = compress_logs and zstd is not None
+        self.docker_client = docker_client
+
+        # Docker and compose versions do not change during a run, so they are looked up once
+        self._versions: Optional[Dict[str, str]] = None
+
+        self.set_output_dir(output_dir)
+
+    def set_output_dir(self, output_dir: Path) -> None:
+        """Point the collector at a new output directory, e.g. for the next test run.
+
         Args:
             output_dir: Directory to save container logs
         """
@@ -57,6 +101,119 @@ class ContainerLogCollector:
 
         return results
 
+    def collect_container_logs_batched(self, container_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Collect logs from containers of one Compose project with a single ``docker compose logs`` call.
+
+        Falls back to :meth:`collect_container_logs` when the project cannot be
+        determined or the combined output cannot be attributed to the containers.
+
+        Args:
+            container_names: List of container names to collect logs from
+
+        Returns:
+            Dictionary mapping container names to log collection results
+        """
+        if not container_names:
+            return {}
+
+        logger.info(f"Collecting logs from {len(container_names)} containers in one batch")
+
+        try:
+            projects = self._resolve_compose_projects(container_names)
+            project_names = set(projects.values())
+            if len(project_names) != 1 or "" in project_names:
+                logger.debug("Containers do not share a single Compose project, collecting logs one by one")
+                return self.collect_container_logs(container_names)
+
+            logs_cmd = ["docker", "compose", "-p", project_names.pop(), "logs", "--no-color", "--timestamps"]
+            logs_result = subprocess.run(logs_cmd, capture_output=True, text=True, timeout=60)
+        except subprocess.TimeoutExpired:
+            logger.warning("Timeout collecting batched container logs, collecting logs one by one")
+            return self.collect_container_logs(container_names)
+
+        log_lines = self._split_compose_logs(logs_result.stdout)
+        if logs_result.returncode != 0 or (log_lines and not log_lines.keys() & set(container_names)):
+            logger.warning("Could not attribute batched container logs, collecting logs one by one")
+            return self.collect_container_logs(container_names)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        timestamp = datetime.now().isoformat()
+        command = " ".join(logs_cmd)
+
+        for container_name in container_names:
+            if container_name not in projects:
+                results[container_name] = {
+                    "success": False,
+                    "error": f"Container {container_name} not found",
+                    "log_file": None,
+                    "log_size": 0,
+                }
+                continue
+
+            log_content = _LOG_HEADER_TEMPLATE.format(
+                name=container_name, timestamp=timestamp, command=command, exit_code=logs_result.returncode
+            )
+            lines = log_lines.get(container_name)
+            if lines:
+                log_content += "# STDOUT:\n" + "".join(lines) + "\n\n"
+            else:
+                log_content += "# No log output captured\n"
+
+            try:
+                results[container_name] = {
+                    "success": True,
+                    "error": None,
+                    **self._write_log_file(self.logs_dir / f"{container_name}.log", log_content),
+                    "exit_code": logs_result.returncode,
+                }
+            except OSError as e:
+                logger.error(f"Error writing logs for {container_name}: {e}")
+                results[container_name] = {"success": False, "error": str(e), "log_file": None, "log_size": 0}
+
+        return results
+
+    @staticmethod
+    def _resolve_compose_projects(container_names: List[str]) -> Dict[str, str]:
+        """Look up the Compose project label of several containers with one ``docker inspect``.
+
+        Args:
+            container_names: List of container names
+
+        Returns:
+            Dictionary mapping each existing container name to its Compose project (empty if unlabelled)
+        """
+        inspect_cmd = [
+            "docker",
+            "inspect",
+            "--format",
+            '{{.Name}} {{index .Config.Labels "com.docker.compose.project"}}',
+            *container_names,
+        ]
+        # A non-zero exit only means some containers are missing; the found ones are still printed
+        inspect_result = subprocess.run(inspect_cmd, capture_output=True, text=True, timeout=10)
+
+        projects = {}
+        for line in inspect_result.stdout.splitlines():
+            name, _, project = line.strip().partition(" ")
+            if name:
+                projects[name.lstrip("/")] = project
+        return projects
+
+    @staticmethod
+    def _split_compose_logs(output: str) -> Dict[str, List[str]]:
+        """Split combined ``docker compose logs`` output into per-container lines.
+
+        Args:
+            output: Output of ``docker compose logs`` with the default ``name | `` prefix
+
+        Returns:
+            Dictionary mapping container names to their log lines (prefix removed)
+        """
+        log_lines: DefaultDict[str, List[str]] = defaultdict(list)
+        for match in _COMPOSE_LOG_LINE.finditer(output):
+            log_lines[match.group(1)].append(match.group(2))
+        return log_lines
+
     def _collect_single_container_log(self, container_name: str) -> Dict[str, str]:
         """Collect logs from a single container.
 
@@ -69,11 +226,10 @@ class ContainerLogCollector:
         log_file = self.logs_dir / f"{container_name}.log"
 
         try:
-            # Check if container exists
-            check_cmd = ["docker", "inspect", container_name]
-            check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=10)
+            # Check if container exists (and where its json-file log lives)
+            log_path = self._inspect_log_path(container_name)
 
-            if check_result.returncode != 0:
+            if log_path is None:
                 return {
                     "success": False,
                     "error": f"Container {container_name} not found",
@@ -84,47 +240,50 @@ class ContainerLogCollector:
             # Collect logs with timestamps
             logs_cmd = ["docker", "logs", "--timestamps", "--details", container_name]
 
-            logs_result = subprocess.run(logs_cmd, capture_output=True, text=True, timeout=30)
+            # Skip the docker logs call entirely when the container never wrote any output
+            if self._is_log_path_empty(log_path):
+                log_content = _LOG_HEADER_TEMPLATE.format(
+                    name=container_name,
+                    timestamp=datetime.now().isoformat(),
+                    command=" ".join(logs_cmd),
+                    exit_code=0,
+                )
+                log_content += "# No log output captured\n"
 
-            # Create log content with header
-            timestamp = datetime.now().isoformat()
-            log_content = f"""# Container Log Collection
-# Container: {container_name}
-# Collection Time: {timestamp}
-# Command: {' '.join(logs_cmd)}
-# Exit Code: {logs_result.returncode}
-# ================================================================================
+                return {"success": True, "error": None, **self._write_log_file(log_file, log_content), "exit_code": 0}
 
-"""
+            exit_code, stdout, stderr = self._read_container_logs(container_name, logs_cmd)
+
+            # Create log content with header
+            log_content = _LOG_HEADER_TEMPLATE.format(
+                name=container_name,
+                timestamp=datetime.now().isoformat(),
+                command=" ".join(logs_cmd),
+                exit_code=exit_code,
+            )
 
             # Add stdout if available
-            if logs_result.stdout:
+            if stdout:
                 log_content += "# STDOUT:\n"
-                log_content += logs_result.stdout
+                log_content += stdout
                 log_content += "\n\n"
 
             # Add stderr if available
-            if logs_result.stderr:
+            if stderr:
                 log_content += "# STDERR:\n"
-                log_content += logs_result.stderr
+                log_content += stderr
                 log_content += "\n\n"
 
             # If no output, note that
-            if not logs_result.stdout and not logs_result.stderr:
+            if not stdout and not stderr:
                 log_content += "# No log output captured\n"
 
             # Write log file
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(log_content)
-
-            log_size = log_file.stat().st_size
-
             return {
                 "success": True,
                 "error": None,
-                "log_file": str(log_file),
-                "log_size": log_size,
-                "exit_code": logs_result.returncode,
+                **self._write_log_file(log_file, log_content),
+                "exit_code": exit_code,
             }
 
         except subprocess.TimeoutExpired:
@@ -137,6 +296,98 @@ class ContainerLogCollector:
         except Exception as e:
             return {"success": False, "error": f"Error collecting logs: {str(e)}", "log_file": None, "log_size": 0}
 
+    def _inspect_log_path(self, container_name: str) -> Optional[str]:
+        """Look up where a container's json-file log lives.
+
+        Args:
+            container_name: Name of the container
+
+        Returns:
+            The ``.LogPath`` value (possibly empty), or None if the container does not exist
+        """
+        if self.docker_client is not None:
+            try:
+                return self.docker_client.inspect_container(container_name).get("LogPath") or ""
+            except Exception as e:
+                if docker is not None and isinstance(e, docker.errors.NotFound):
+                    logger.debug(f"Container {container_name} not found: {e}")
+                    return None
+                # A daemon or connection error says nothing about the container; ask the CLI instead
+                logger.warning(f"Docker API inspect of {container_name} failed, falling back to docker inspect: {e}")
+
+        check_cmd = ["docker", "inspect", "--format", "{{.LogPath}}", container_name]
+        check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=10)
+        if check_result.returncode != 0:
+            return None
+        return check_result.stdout.strip()
+
+    def _read_container_logs(self, container_name: str, logs_cmd: List[str]) -> Tuple[int, str, str]:
+        """Read a container's stdout and stderr logs.
+
+        Args:
+            container_name: Name of the container
+            logs_cmd: docker CLI command used when no API client is configured
+
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+        """
+        if self.docker_client is not None:
+            stdout = self.docker_client.logs(container_name, stdout=True, stderr=False, timestamps=True)
+            stderr = self.docker_client.logs(container_name, stdout=False, stderr=True, timestamps=True)
+            return 0, stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+
+        logs_result = subprocess.run(logs_cmd, capture_output=True, text=True, timeout=30)
+        return logs_result.returncode, logs_result.stdout, logs_result.stderr
+
+    def _write_log_file(self, log_file: Path, log_content: str) -> Dict[str, Any]:
+        """Write collected log content, zstd-compressed when enabled.
+
+        Args:
+            log_file: Uncompressed log file path
+            log_content: Full log text including header
+
+        Returns:
+            Dictionary with the written file path and its on-disk and uncompressed sizes
+        """
+        data = log_content.encode("utf-8")
+
+        if self.compress_logs:
+            log_file = log_file.with_suffix(".log.zst")
+            with open(log_file, "wb") as raw, zstd.ZstdCompressor(level=3).stream_writer(raw) as compressor:
+                compressor.write(data)
+        else:
+            with open(log_file, "wb") as f:
+                f.write(data)
+
+        return {
+            "log_file": str(log_file),
+            "log_size": log_file.stat().st_size,
+            "uncompressed_size": len(data),
+            "compressed": self.compress_logs,
+        }
+
+    @staticmethod
+    def _is_log_path_empty(log_path: str) -> bool:
+        """Check whether a container's on-disk log file exists and is empty.
+
+        The Docker log file is usually only readable by root, and is not visible at
+        all when the daemon runs in a VM, so any failure to stat it means "unknown"
+        and the caller falls back to ``docker logs``.
+
+        Args:
+            log_path: Value of ``.LogPath`` from ``docker inspect``
+
+        Returns:
+            True only if the log file could be inspected and has zero size
+        """
+        if not log_path:
+            return False
+
+        try:
+            return Path(log_path).stat().st_size == 0
+        except OSError:
+            return False
+
     def collect_system_info(self) -> Dict[str, str]:
         """Collect system information for debugging context.
 
@@ -146,15 +397,21 @@ class ContainerLogCollector:
         info = {}
 
         try:
-            # Docker version
-            docker_version = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=10)
-            info["docker_version"] = docker_version.stdout.strip() if docker_version.returncode == 0 else "Unknown"
+            if self._versions is None:
+                # Docker version
+                docker_version = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=10)
+
+                # Docker compose version
+                compose_version = subprocess.run(
+                    ["docker", "compose", "version"], capture_output=True, text=True, timeout=10
+                )
+
+                self._versions = {
+                    "docker_version": docker_version.stdout.strip() if docker_version.returncode == 0 else "Unknown",
+                    "compose_version": compose_version.stdout.strip() if compose_version.returncode == 0 else "Unknown",
+                }
 
-            # Docker compose version
-            compose_version = subprocess.run(
-                ["docker", "compose", "version"], capture_output=True, text=True, timeout=10
-            )
-            info["compose_version"] = compose_version.stdout.strip() if compose_version.returncode == 0 else "Unknown"
+            info.update(self._versions)
 
             # System info
             info["collection_time"] = datetime.now().isoformat()
@@ -313,10 +570,13 @@ class ContainerLogCollector:
             summary["total_server_log_size_bytes"] = 0
             summary["total_combined_log_size_bytes"] = container_log_size
 
-        import json
-
-        with open(summary_file, "w") as f:
+        # Write to a temp file and rename so a crash never leaves truncated JSON behind
+        tmp_file = summary_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(summary, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, summary_file)
 
         logger.info(f"Log collection summary saved to {summary_file}")
         return summary_file
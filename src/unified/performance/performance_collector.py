@@ -4,25 +4,162 @@ This module provides functionality to collect, aggregate, and analyze performanc
 data from container lifecycle events and health checks.
 """
 
-import json
 import logging
+import os
+from collections import defaultdict, deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import GeneratorType
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TextIO,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from .event_monitor import ContainerEvent, ContainerEventMonitor
 from .health_watcher import HealthCheckWatcher, HealthStatus
+from .json_io import dumps, read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+TimestampKey = Literal[
+    "create_time",
+    "start_time",
+    "health_starting_time",
+    "health_healthy_time",
+    "health_unhealthy_time",
+    "stop_time",
+    "destroy_time",
+]
+
+
+class ContainerMetrics(TypedDict):
+    """Per-container metrics: timestamps in epoch seconds, durations in seconds."""
+
+    create_time: Optional[float]
+    start_time: Optional[float]
+    health_starting_time: Optional[float]
+    health_healthy_time: Optional[float]
+    health_unhealthy_time: Optional[float]
+    stop_time: Optional[float]
+    destroy_time: Optional[float]
+    startup_duration: Optional[float]
+    health_check_duration: Optional[float]
+    total_startup_time: Optional[float]
+    shutdown_duration: Optional[float]
+    health_check_failures: int
+    restart_count: int
+
+
+@lru_cache(maxsize=4096)
+def _epoch_to_iso(timestamp: float) -> str:
+    """Convert epoch seconds to a local ISO 8601 string.
+
+    Containers started by the same compose run share many timestamps, so the
+    conversion is memoized across containers.
+
+    Args:
+        timestamp: Epoch seconds
+
+    Returns:
+        ISO format string
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _stream_json(f: TextIO, data: Any, level: int = 0) -> None:
+    """Write indented JSON incrementally.
+
+    Mappings passed as generators of ``(key, value)`` pairs are written one entry
+    at a time, so large nested structures never need to be materialized as a
+    whole. Any other value is serialized in one piece and re-indented to ``level``.
+
+    Args:
+        f: Text file to write to
+        data: JSON-serializable data, or a generator of key/value pairs
+        level: Current nesting depth
+    """
+    if not isinstance(data, GeneratorType):
+        f.write(dumps(data, pretty=True).decode().replace("\n", "\n" + "  " * level))
+        return
+
+    empty = True
+    entry_indent = "  " * (level + 1)
+    for key, value in data:
+        f.write("{\n" if empty else ",\n")
+        f.write(f"{entry_indent}{dumps(key).decode()}: ")
+        _stream_json(f, value, level + 1)
+        empty = False
+
+    f.write("{}" if empty else "\n" + "  " * level + "}")
 
-class ContainerPerformanceMetrics:
-    """Performance metrics for a single container."""
 
-    def __init__(self, container_name: str, image: str = ""):
+class ContainerPerformanceMetrics:
+    """Performance metrics for a single container.
+
+    Lifecycle timestamps in ``metrics`` are stored as float epoch seconds so derived
+    durations are plain float subtraction; ``to_dict()`` renders them as ISO strings.
+    """
+
+    TIMESTAMP_KEYS: Tuple[TimestampKey, ...] = (
+        "create_time",
+        "start_time",
+        "health_starting_time",
+        "health_healthy_time",
+        "health_unhealthy_time",
+        "stop_time",
+        "destroy_time",
+    )
+
+    __slots__ = (
+        "container_name",
+        "image",
+        "_on_change",
+        "metrics",
+        "events",
+        "health_history",
+        "event_count",
+        "health_record_count",
+        "_dict_cache",
+        "_dirty",
+    )
+
+    # Maximum number of raw events / health records retained per container
+    EVENT_CAP = 1024
+    HEALTH_CAP = 1024
+
+    # Event actions / health statuses that simply record a lifecycle timestamp
+    _ACTION_TIMESTAMP_KEYS: Dict[str, TimestampKey] = {
+        "create": "create_time",
+        "start": "start_time",
+        "stop": "stop_time",
+        "kill": "stop_time",
+        "die": "stop_time",
+        "destroy": "destroy_time",
+    }
+    _HEALTH_TIMESTAMP_KEYS: Dict[str, TimestampKey] = {
+        HealthStatus.STARTING: "health_starting_time",
+        HealthStatus.HEALTHY: "health_healthy_time",
+        HealthStatus.UNHEALTHY: "health_unhealthy_time",
+    }
+
+    def __init__(self, container_name: str, image: str = "", on_change: Optional[Callable[[int], None]] = None):
         self.container_name = container_name
         self.image = image
-        self.metrics = {
+        # Called with the number of new health records whenever data changes (used by the owning environment)
+        self._on_change = on_change
+        self.metrics: ContainerMetrics = {
             "create_time": None,
             "start_time": None,
             "health_starting_time": None,
@@ -37,8 +174,15 @@ class ContainerPerformanceMetrics:
             "health_check_failures": 0,
             "restart_count": 0,
         }
-        self.events: List[ContainerEvent] = []
-        self.health_history: List[HealthStatus] = []
+        # Only the most recent records are kept; metrics only need the latest timestamps
+        self.events: Deque[ContainerEvent] = deque(maxlen=self.EVENT_CAP)
+        self.health_history: Deque[HealthStatus] = deque(maxlen=self.HEALTH_CAP)
+        self.event_count = 0
+        self.health_record_count = 0
+
+        # Serialized form is cached until the next event or health record arrives
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._dirty = True
 
     def add_event(self, event: ContainerEvent) -> None:
         """Add a container event to the metrics.
@@ -46,37 +190,46 @@ class ContainerPerformanceMetrics:
         Args:
             event: Container event to add
         """
+        self._apply_event(event)
+
+        # Recalculate derived metrics
+        self._metrics_changed()
+
+    def add_events(self, events: List[ContainerEvent]) -> None:
+        """Add several container events, recalculating derived metrics only once.
+
+        Args:
+            events: Container events to add, in arrival order
+        """
+        for event in events:
+            self._apply_event(event)
+
+        self._metrics_changed()
+
+    def _apply_event(self, event: ContainerEvent) -> None:
+        """Record an event and update raw timestamps/counters without derived metrics.
+
+        Args:
+            event: Container event to apply
+        """
         self.events.append(event)
+        self.event_count += 1
+        self._dirty = True
+        timestamp = event.timestamp.timestamp()
 
         # Update container image if not set and event has it
         if not self.image and event.image:
             self.image = event.image
 
         # Update metrics based on event type
-        if event.action == "create":
-            self.metrics["create_time"] = event.timestamp
-        elif event.action == "start":
-            self.metrics["start_time"] = event.timestamp
-        elif event.action == "restart":
+        action = event.action
+        timestamp_key = self._ACTION_TIMESTAMP_KEYS.get(action)
+        if timestamp_key is not None:
+            self.metrics[timestamp_key] = timestamp
+        elif action == "health_status":
+            self._record_health_status(event.health_status, timestamp)
+        elif action == "restart":
             self.metrics["restart_count"] += 1
-        elif event.action in ["stop", "kill", "die"]:
-            self.metrics["stop_time"] = event.timestamp
-        elif event.action == "destroy":
-            self.metrics["destroy_time"] = event.timestamp
-        elif event.action == "health_status":
-            # Parse health status from event
-            attrs = event.raw_data.get("Actor", {}).get("Attributes", {})
-            health_status = attrs.get("health_status", "")
-            if health_status == "starting":
-                self.metrics["health_starting_time"] = event.timestamp
-            elif health_status == "healthy":
-                self.metrics["health_healthy_time"] = event.timestamp
-            elif health_status == "unhealthy":
-                self.metrics["health_unhealthy_time"] = event.timestamp
-                self.metrics["health_check_failures"] += 1
-
-        # Recalculate derived metrics
-        self._calculate_derived_metrics()
 
     def add_health_status(self, health_status: HealthStatus) -> None:
         """Add a health status record to the metrics.
@@ -84,84 +237,144 @@ class ContainerPerformanceMetrics:
         Args:
             health_status: Health status to add
         """
+        self._apply_health_status(health_status)
+
+        # Recalculate derived metrics
+        self._metrics_changed(new_health_records=1)
+
+    def add_health_statuses(self, health_statuses: List[HealthStatus]) -> None:
+        """Add several health status records, recalculating derived metrics only once.
+
+        Args:
+            health_statuses: Health statuses to add, in arrival order
+        """
+        for health_status in health_statuses:
+            self._apply_health_status(health_status)
+
+        self._metrics_changed(new_health_records=len(health_statuses))
+
+    def _apply_health_status(self, health_status: HealthStatus) -> None:
+        """Record a health status and update raw timestamps/counters without derived metrics.
+
+        Args:
+            health_status: Health status to apply
+        """
         self.health_history.append(health_status)
+        self.health_record_count += 1
+        self._dirty = True
+        timestamp = health_status.timestamp.timestamp()
 
         # Update metrics based on health status
-        if health_status.status == "starting":
-            self.metrics["health_starting_time"] = health_status.timestamp
-        elif health_status.status == "healthy":
-            self.metrics["health_healthy_time"] = health_status.timestamp
-        elif health_status.status == "unhealthy":
-            self.metrics["health_unhealthy_time"] = health_status.timestamp
+        self._record_health_status(health_status.status, timestamp)
+
+    def _record_health_status(self, status: str, timestamp: float) -> None:
+        """Record the timestamp of a health status transition.
+
+        Args:
+            status: Health status string (starting, healthy, unhealthy)
+            timestamp: Epoch seconds of the transition
+        """
+        timestamp_key = self._HEALTH_TIMESTAMP_KEYS.get(status)
+        if timestamp_key is None:
+            return
+
+        self.metrics[timestamp_key] = timestamp
+        if status == HealthStatus.UNHEALTHY:
             self.metrics["health_check_failures"] += 1
 
-        # Recalculate derived metrics
+    def _metrics_changed(self, new_health_records: int = 0) -> None:
+        """Recalculate derived metrics and notify the owner after new data.
+
+        Args:
+            new_health_records: Number of health records added since the last notification
+        """
         self._calculate_derived_metrics()
 
+        if self._on_change is not None:
+            self._on_change(new_health_records)
+
     def _calculate_derived_metrics(self) -> None:
         """Calculate derived performance metrics."""
-        # Calculate startup duration (start to healthy)
-        start_time = self.metrics.get("start_time")
-        healthy_time = self.metrics.get("health_healthy_time")
-
-        if start_time and healthy_time:
-            self.metrics["startup_duration"] = (healthy_time - start_time).total_seconds()
-
-        # Calculate health check duration (starting to healthy)
-        starting_time = self.metrics.get("health_starting_time")
-        if starting_time and healthy_time:
-            self.metrics["health_check_duration"] = (healthy_time - starting_time).total_seconds()
+        metrics = self.metrics
+        create_time = metrics["create_time"]
+        start_time = metrics["start_time"]
+        starting_time = metrics["health_starting_time"]
+        healthy_time = metrics["health_healthy_time"]
+        stop_time = metrics["stop_time"]
+        destroy_time = metrics["destroy_time"]
+
+        if healthy_time:
+            # Calculate startup duration (start to healthy)
+            if start_time:
+                metrics["startup_duration"] = healthy_time - start_time
+
+            # Calculate health check duration (starting to healthy)
+            if starting_time:
+                metrics["health_check_duration"] = healthy_time - starting_time
 
         # Calculate total startup time (create to healthy)
-        create_time = self.metrics.get("create_time")
-        if create_time and healthy_time:
-            self.metrics["total_startup_time"] = (healthy_time - create_time).total_seconds()
-        elif create_time and start_time:
-            # For containers without health checks, use create to start
-            self.metrics["total_startup_time"] = (start_time - create_time).total_seconds()
+        if create_time:
+            if healthy_time:
+                metrics["total_startup_time"] = healthy_time - create_time
+            elif start_time:
+                # For containers without health checks, use create to start
+                metrics["total_startup_time"] = start_time - create_time
 
         # Calculate shutdown duration (stop to destroy)
-        stop_time = self.metrics.get("stop_time")
-        destroy_time = self.metrics.get("destroy_time")
-
         if stop_time and destroy_time:
-            self.metrics["shutdown_duration"] = (destroy_time - stop_time).total_seconds()
+            metrics["shutdown_duration"] = destroy_time - stop_time
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary representation.
 
         Returns:
-            Dictionary representation of metrics
+            Dictionary representation of metrics; callers may modify it without
+            affecting later calls
         """
-        # Calculate derived metrics before serialization
-        self._calculate_derived_metrics()
+        # Derived metrics are already current: every add_* call recalculates them
+        cached = self._dict_cache
+        if self._dirty or cached is None:
+            # Convert epoch timestamps to ISO format strings
+            serialized_metrics: Dict[str, Any] = dict(self.metrics)
+            for key in self.TIMESTAMP_KEYS:
+                value = serialized_metrics[key]
+                if value is not None:
+                    serialized_metrics[key] = _epoch_to_iso(value)
+
+            cached = self._dict_cache = {
+                "container_name": self.container_name,
+                "image": self.image,
+                "metrics": serialized_metrics,
+                "event_count": self.event_count,
+                "health_record_count": self.health_record_count,
+            }
+            self._dirty = False
 
-        # Convert datetime objects to ISO format strings
-        serialized_metrics = {}
-        for key, value in self.metrics.items():
-            if isinstance(value, datetime):
-                serialized_metrics[key] = value.isoformat()
-            else:
-                serialized_metrics[key] = value
-
-        return {
-            "container_name": self.container_name,
-            "image": self.image,
-            "metrics": serialized_metrics,
-            "event_count": len(self.events),
-            "health_record_count": len(self.health_history),
-        }
+        # Copy the top level and the nested metrics so callers cannot alter the cache
+        result = dict(cached)
+        result["metrics"] = dict(cached["metrics"])
+        return result
 
 
 class EnvironmentPerformanceMetrics:
     """Performance metrics for an entire environment."""
 
+    __slots__ = (
+        "environment_name",
+        "start_time",
+        "end_time",
+        "containers",
+        "environment_metrics",
+        "_metrics_dirty",
+        "_total_health_checks",
+    )
+
     def __init__(self, environment_name: str):
         self.environment_name = environment_name
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.containers: Dict[str, ContainerPerformanceMetrics] = {}
-        self.environment_metrics = {
+        self.environment_metrics: Dict[str, Any] = {
             "total_startup_time": None,
             "total_shutdown_time": None,
             "slowest_container": None,
@@ -171,6 +384,19 @@ class EnvironmentPerformanceMetrics:
             "container_count": 0,
         }
 
+        # Set whenever a container is added or receives data; cleared by calculate_environment_metrics
+        self._metrics_dirty = True
+        self._total_health_checks = 0
+
+    def _on_container_change(self, new_health_records: int) -> None:
+        """Flag environment-level metrics as needing recalculation.
+
+        Args:
+            new_health_records: Number of health records the container just received
+        """
+        self._metrics_dirty = True
+        self._total_health_checks += new_health_records
+
     def add_container(self, container_name: str, image: str = "") -> ContainerPerformanceMetrics:
         """Add a container to the environment metrics.
 
@@ -182,7 +408,10 @@ class EnvironmentPerformanceMetrics:
             Container performance metrics object
         """
         if container_name not in self.containers:
-            self.containers[container_name] = ContainerPerformanceMetrics(container_name, image)
+            self.containers[container_name] = ContainerPerformanceMetrics(
+                container_name, image, on_change=self._on_container_change
+            )
+            self._metrics_dirty = True
 
         return self.containers[container_name]
 
@@ -198,24 +427,38 @@ class EnvironmentPerformanceMetrics:
         return self.containers.get(container_name)
 
     def calculate_environment_metrics(self) -> None:
-        """Calculate environment-level performance metrics."""
-        if not self.containers:
+        """Calculate environment-level performance metrics.
+
+        This is a no-op unless a container was added or received new data since the
+        last calculation.
+        """
+        if not self.containers or not self._metrics_dirty:
             return
 
-        startup_times = []
-        shutdown_times = []
+        startup_sum = 0.0
+        startup_count = 0
+        slowest_container, slowest_time = None, float("-inf")
+        fastest_container, fastest_time = None, float("inf")
+        max_shutdown_time = None
         total_failures = 0
 
-        for container_metrics in self.containers.values():
+        for container_name, container_metrics in self.containers.items():
             metrics = container_metrics.metrics
 
-            # Collect startup times
-            if metrics.get("startup_duration"):
-                startup_times.append(metrics["startup_duration"])
-
-            # Collect shutdown times
-            if metrics.get("shutdown_duration"):
-                shutdown_times.append(metrics["shutdown_duration"])
+            # Track startup time aggregates and the slowest/fastest container in one pass
+            startup_duration = metrics.get("startup_duration")
+            if startup_duration:
+                startup_sum += startup_duration
+                startup_count += 1
+                if startup_duration >= slowest_time:
+                    slowest_container, slowest_time = container_name, startup_duration
+                if startup_duration <= fastest_time:
+                    fastest_container, fastest_time = container_name, startup_duration
+
+            # Track the longest shutdown
+            shutdown_duration = metrics.get("shutdown_duration")
+            if shutdown_duration and (max_shutdown_time is None or shutdown_duration > max_shutdown_time):
+                max_shutdown_time = shutdown_duration
 
             # Count health check failures
             total_failures += metrics.get("health_check_failures", 0)
@@ -223,27 +466,20 @@ class EnvironmentPerformanceMetrics:
         # Calculate environment metrics
         self.environment_metrics["container_count"] = len(self.containers)
 
-        if startup_times:
-            self.environment_metrics["total_startup_time"] = max(startup_times)
-            self.environment_metrics["average_startup_time"] = sum(startup_times) / len(startup_times)
-
-            # Find slowest and fastest containers
-            slowest_time = max(startup_times)
-            fastest_time = min(startup_times)
-
-            for container_name, container_metrics in self.containers.items():
-                if container_metrics.metrics.get("startup_duration") == slowest_time:
-                    self.environment_metrics["slowest_container"] = container_name
-                if container_metrics.metrics.get("startup_duration") == fastest_time:
-                    self.environment_metrics["fastest_container"] = container_name
+        if startup_count:
+            self.environment_metrics["total_startup_time"] = slowest_time
+            self.environment_metrics["average_startup_time"] = startup_sum / startup_count
+            self.environment_metrics["slowest_container"] = slowest_container
+            self.environment_metrics["fastest_container"] = fastest_container
 
-        if shutdown_times:
-            self.environment_metrics["total_shutdown_time"] = max(shutdown_times)
+        if max_shutdown_time is not None:
+            self.environment_metrics["total_shutdown_time"] = max_shutdown_time
 
         # Calculate health check failure rate
-        total_health_checks = sum(len(c.health_history) for c in self.containers.values())
-        if total_health_checks > 0:
-            self.environment_metrics["health_check_failure_rate"] = total_failures / total_health_checks
+        if self._total_health_checks > 0:
+            self.environment_metrics["health_check_failure_rate"] = total_failures / self._total_health_checks
+
+        self._metrics_dirty = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert environment metrics to dictionary representation.
@@ -259,6 +495,46 @@ class EnvironmentPerformanceMetrics:
             "containers": {name: container.to_dict() for name, container in self.containers.items()},
         }
 
+    def iter_dict_items(self) -> Iterator[Tuple[str, Any]]:
+        """Yield the ``to_dict()`` entries lazily, one container at a time.
+
+        Yields:
+            Key/value pairs; ``containers`` is itself a generator of per-container pairs
+        """
+        yield "environment_name", self.environment_name
+        yield "start_time", self.start_time.isoformat() if self.start_time else None
+        yield "end_time", self.end_time.isoformat() if self.end_time else None
+        yield "environment_metrics", self.environment_metrics
+        yield "containers", ((name, container.to_dict()) for name, container in self.containers.items())
+
+
+def _build_environment_report(env_metrics: EnvironmentPerformanceMetrics) -> Dict[str, Any]:
+    """Build the report section for a single environment.
+
+    Kept at module level and free of collector state so environments can be
+    reported independently of each other.
+
+    Args:
+        env_metrics: Environment metrics to report on
+
+    Returns:
+        Environment report dictionary
+    """
+    containers = {}
+    for container_name, container_metrics in env_metrics.containers.items():
+        metrics = container_metrics.metrics
+        containers[container_name] = {
+            "startup_duration": metrics["startup_duration"],
+            "health_check_failures": metrics["health_check_failures"],
+            "restart_count": metrics["restart_count"],
+        }
+
+    return {
+        "metrics": env_metrics.environment_metrics,
+        "container_count": len(containers),
+        "containers": containers,
+    }
+
 
 class PerformanceCollector:
     """Collects and aggregates performance data from multiple sources."""
@@ -275,6 +551,9 @@ class PerformanceCollector:
         self.environments: Dict[str, EnvironmentPerformanceMetrics] = {}
         self.baselines: Dict[str, Dict[str, float]] = {}
 
+        # (id(source list), environment) -> (items collected so far, last item collected)
+        self._cursors: Dict[Tuple[int, str], Tuple[int, Any]] = {}
+
         # Load baseline data if it exists
         self._load_baselines()
 
@@ -301,19 +580,16 @@ class PerformanceCollector:
         """
         env_metrics = self.add_environment(environment_name)
 
-        # Group events by container
-        container_events: Dict[str, List[ContainerEvent]] = {}
-        for event in event_monitor.events:
+        # Group events by container, skipping events collected by an earlier call
+        container_events: DefaultDict[str, List[ContainerEvent]] = defaultdict(list)
+        for event in self._new_items(event_monitor.events, environment_name):
             if event.container_name:
-                if event.container_name not in container_events:
-                    container_events[event.container_name] = []
                 container_events[event.container_name].append(event)
 
         # Add events to container metrics
         for container_name, events in container_events.items():
             container_metrics = env_metrics.add_container(container_name)
-            for event in events:
-                container_metrics.add_event(event)
+            container_metrics.add_events(events)
 
     def collect_from_health_watcher(self, health_watcher: HealthCheckWatcher, environment_name: str) -> None:
         """Collect performance data from health watcher.
@@ -325,54 +601,78 @@ class PerformanceCollector:
         env_metrics = self.add_environment(environment_name)
 
         # Group health history by container
-        container_health: Dict[str, List[HealthStatus]] = {}
-        for health_status in health_watcher.health_history:
-            if health_status.container_name not in container_health:
-                container_health[health_status.container_name] = []
+        container_health: DefaultDict[str, List[HealthStatus]] = defaultdict(list)
+        for health_status in self._new_items(health_watcher.health_history, environment_name):
             container_health[health_status.container_name].append(health_status)
 
         # Add health data to container metrics
         for container_name, health_history in container_health.items():
             container_metrics = env_metrics.add_container(container_name)
-            for health_status in health_history:
-                container_metrics.add_health_status(health_status)
+            container_metrics.add_health_statuses(health_history)
+
+    def _new_items(self, items: List[Any], environment_name: str) -> List[Any]:
+        """Return the items appended to a monitor's list since it was last collected for an environment.
 
-    def finalize_environment(self, environment_name: str) -> None:
+        Args:
+            items: Append-only list owned by a monitor (cleared between test iterations)
+            environment_name: Environment name the items are collected into
+
+        Returns:
+            Items not yet collected
+        """
+        key = (id(items), environment_name)
+        position, last_item = self._cursors.get(key, (0, None))
+
+        # The monitor cleared its list since the last collection: start over
+        if position > len(items) or (position and items[position - 1] is not last_item):
+            position = 0
+
+        new_items = items[position:]
+        if new_items:
+            self._cursors[key] = (position + len(new_items), new_items[-1])
+        return new_items
+
+    def finalize_environment(self, environment_name: str, end_time: Optional[datetime] = None) -> None:
         """Finalize environment metrics and calculate derived values.
 
         Args:
             environment_name: Environment name
+            end_time: End time to record (default: now); pass one value when finalizing a batch
         """
         if environment_name in self.environments:
             env_metrics = self.environments[environment_name]
-            env_metrics.end_time = datetime.now()
+            env_metrics.end_time = end_time or datetime.now()
             env_metrics.calculate_environment_metrics()
 
-    def save_performance_data(self, filename: Optional[str] = None) -> Path:
+    def save_performance_data(self, filename: Optional[str] = None, output_dir: Optional[Path] = None) -> Path:
         """Save performance data to JSON file.
 
         Args:
             filename: Optional filename (default: lifecycle-performance.json)
+            output_dir: Directory to save into instead of the collector's output directory
 
         Returns:
             Path to saved file
         """
+        now = datetime.now()
+
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"lifecycle-performance-{timestamp}.json"
 
-        output_path = self.output_dir / filename
+        output_path = Path(output_dir or self.output_dir) / filename
 
-        # Prepare data for serialization
-        data = {
-            "timestamp": datetime.now().isoformat(),
-            "environments": {name: env.to_dict() for name, env in self.environments.items()},
-            "baselines": self.baselines,
-        }
+        # Stream environments to the file one container at a time instead of building the full document
+        def iter_data() -> Iterator[Tuple[str, Any]]:
+            yield "timestamp", now.isoformat()
+            yield "environments", ((name, env.iter_dict_items()) for name, env in self.environments.items())
+            yield "baselines", self.baselines
 
-        # Save to JSON file
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Stream into a temporary file and move it into place so a crash never leaves a truncated file
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            _stream_json(f, iter_data())
+        os.replace(tmp_path, output_path)
 
         logger.info(f"Performance data saved to {output_path}")
         return output_path
@@ -385,14 +685,16 @@ class PerformanceCollector:
         """
         file_path = Path(filename)
 
-        if not file_path.exists():
+        try:
+            data = read_json(file_path)
+        except FileNotFoundError:
             logger.warning(f"Performance data file not found: {file_path}")
             return
+        except Exception as e:
+            logger.error(f"Error loading performance data from {file_path}: {e}")
+            return
 
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-
             # Load environments (simplified - just for reference)
             self.environments.clear()
             for env_name, env_data in data.get("environments", {}).items():
@@ -416,13 +718,15 @@ class PerformanceCollector:
         """Load baseline performance data."""
         baseline_file = self.output_dir / "performance_baselines.json"
 
-        if baseline_file.exists():
-            try:
-                with open(baseline_file) as f:
-                    self.baselines = json.load(f)
-                logger.info("Loaded performance baselines")
-            except Exception as e:
-                logger.error(f"Error loading baselines: {e}")
+        try:
+            self.baselines = read_json(baseline_file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Error loading baselines: {e}")
+            return
+
+        logger.info("Loaded performance baselines")
 
     def save_baselines(self) -> None:
         """Save current performance data as baselines."""
@@ -434,12 +738,10 @@ class PerformanceCollector:
         for env_name, env_metrics in self.environments.items():
             env_baselines = {}
 
-            # Calculate average startup times
-            startup_times = []
-            for container_metrics in env_metrics.containers.values():
-                startup_duration = container_metrics.metrics.get("startup_duration")
-                if startup_duration:
-                    startup_times.append(startup_duration)
+            # Calculate average startup times (builtin sum/min/max over the few containers beat array setup)
+            startup_times = [
+                c.metrics["startup_duration"] for c in env_metrics.containers.values() if c.metrics["startup_duration"]
+            ]
 
             if startup_times:
                 env_baselines["average_startup_time"] = sum(startup_times) / len(startup_times)
@@ -454,8 +756,7 @@ class PerformanceCollector:
 
         # Save to file
         try:
-            with open(baseline_file, "w") as f:
-                json.dump(self.baselines, f, indent=2)
+            write_json(baseline_file, self.baselines, pretty=True)
             logger.info(f"Baselines saved to {baseline_file}")
         except Exception as e:
             logger.error(f"Error saving baselines: {e}")
@@ -469,7 +770,7 @@ class PerformanceCollector:
         Returns:
             Comparison results
         """
-        comparison = {
+        comparison: Dict[str, Any] = {
             "environment": environment_name,
             "has_baseline": environment_name in self.baselines,
             "performance_regression": False,
@@ -523,22 +824,9 @@ class PerformanceCollector:
         }
 
         # Add environment details
-        for env_name, env_metrics in self.environments.items():
-            env_report = {
-                "metrics": env_metrics.environment_metrics,
-                "container_count": len(env_metrics.containers),
-                "containers": {},
-            }
-
-            # Add container details
-            for container_name, container_metrics in env_metrics.containers.items():
-                env_report["containers"][container_name] = {
-                    "startup_duration": container_metrics.metrics.get("startup_duration"),
-                    "health_check_failures": container_metrics.metrics.get("health_check_failures"),
-                    "restart_count": container_metrics.metrics.get("restart_count"),
-                }
-
-            report["environments"][env_name] = env_report
+        report["environments"] = {
+            env_name: _build_environment_report(env_metrics) for env_name, env_metrics in self.environments.items()
+        }
 
         # Add recommendations
         self._add_performance_recommendations(report)
@@ -5,23 +5,186 @@ testing of container environments, monitoring Docker events and health checks
 to measure startup and shutdown performance.
 """
 
+import copy
 import logging
+import os
+import subprocess
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union
 
+from ..environments.config import EnvironmentConfig
 from ..environments.manager import UnifiedEnvironmentManager
 from .event_monitor import ContainerEventMonitor
 from .health_watcher import HealthCheckWatcher
+from .json_io import append_json_line, write_json
 from .log_collector import ContainerLogCollector
 from .performance_collector import PerformanceCollector
 
+try:
+    import docker
+except ImportError:  # pragma: no cover - optional dependency
+    docker = None  # type: ignore[assignment, unused-ignore]
+
 logger = logging.getLogger(__name__)
 
+# One-time containers that exit after completing their work
+_ONE_TIME_SERVICES = frozenset({"volume-setup", "flyway"})
+
+# Separator logged around each environment in sequential runs
+_BANNER = "=" * 60
+
+# Shared read-only fallback for missing nested summaries
+_EMPTY: Dict[str, Any] = {}
+
+# Fixed file names listed in each run's test-metadata.json alongside the results file
+_METADATA_FILES = {
+    "iterations": "iterations.ndjson",
+    "performance_metrics": "performance-metrics.json",
+    "full_events": "full-events.log",
+    "container_logs_dir": "container-logs/",
+    "log_collection_summary": "container-logs/log-collection-summary.json",
+}
+
+
+class TestEnvironmentConfig(EnvironmentConfig):
+    """Environment configuration that loads from the ``environments/test-data`` tree."""
+
+    def __init__(self, project_dir: Union[str, Path]):
+        """Initialize test environment configuration.
+
+        Args:
+            project_dir: Path to the project directory containing configuration files
+        """
+        super().__init__(project_dir)
+        test_data_dir = os.path.join(self.project_dir, "environments", "test-data", "{env}")
+        self._env_file_template = os.path.join(test_data_dir, ".env.{env}")
+        self._compose_file_template = os.path.join(test_data_dir, "docker-compose.{env}.yml")
+
+    def load_environment(self, environment: str) -> Dict[str, Any]:
+        """Load configuration for a test environment."""
+        logger.info(f"Loading test environment configuration for: {environment}")
+
+        # Look in test-data directory structure
+        env_file = Path(self._env_file_template.format(env=environment))
+        if not env_file.exists():
+            raise FileNotFoundError(f"Test environment file not found: {env_file}")
+
+        self.env_vars = self._parse_env_file(env_file)
+
+        # Load docker-compose configuration
+        compose_file = Path(self._compose_file_template.format(env=environment))
+        if not compose_file.exists():
+            raise FileNotFoundError(f"Test docker compose file not found: {compose_file}")
+
+        self.compose_config = self._parse_compose_file(compose_file)
+
+        # Extract service configurations
+        self.service_configs = self._extract_service_configs()
+
+        # Return combined configuration
+        return {
+            "environment": environment,
+            "env_vars": self.env_vars,
+            "compose_config": self.compose_config,
+            "service_configs": self.service_configs,
+            **self.env_vars,  # Include all env vars at top level for backward compatibility
+        }
+
+
+def _mma(values: List[float]) -> Tuple[float, float, float]:
+    """Compute min, max and mean of a non-empty list in a single pass.
+
+    Args:
+        values: Numbers to reduce
+
+    Returns:
+        Tuple of (min, max, mean)
+    """
+    it = iter(values)
+    lowest = highest = total = next(it)
+    count = 1
+    for value in it:
+        total += value
+        if value < lowest:
+            lowest = value
+        elif value > highest:
+            highest = value
+        count += 1
+    return lowest, highest, total / count
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Interpolate a percentile from sorted values.
+
+    Args:
+        ordered: Non-empty values in ascending order
+        fraction: Percentile as a fraction between 0 and 1
+
+    Returns:
+        Linearly interpolated value at the requested rank
+    """
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _summarize_times(values: List[float], include_values: bool = True) -> Dict[str, Any]:
+    """Summarize a non-empty list of durations.
+
+    Args:
+        values: Durations in seconds
+        include_values: Whether to keep the raw values in the summary
+
+    Returns:
+        Dictionary with min, max, average, p50/p95/p99 percentiles and, if requested,
+        the raw values
+    """
+    lowest, highest, average = _mma(values)
+    ordered = sorted(values)
+    summary = {
+        "min": lowest,
+        "max": highest,
+        "average": average,
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+    }
+    if include_values:
+        summary["values"] = values
+    return summary
+
+
+def _connect_docker_api() -> Optional[Any]:
+    """Open a Docker Engine API client to reuse for the whole test run.
+
+    Returns:
+        A connected ``docker.APIClient``, or None when the docker SDK is not installed
+        or the daemon is unreachable, in which case the docker CLI is used instead
+    """
+    if docker is None:
+        return None
+
+    try:
+        client = docker.from_env().api
+        client.ping()
+        return client
+    except Exception as e:
+        logger.debug(f"Docker Engine API unavailable, falling back to the docker CLI: {e}")
+        return None
+
 
 class PerformanceTestRunner:
-    """Orchestrates performance testing of container environments."""
+    """Orchestrates performance testing of container environments.
+
+    Creating a runner starts a ``docker events`` subprocess and health monitoring.
+    Use it as a context manager so the subprocess, background writes and Docker
+    client are released; ``close()`` stops only the monitoring.
+    """
 
     def __init__(
         self, project_dir: Union[str, Path], output_dir: Optional[Path] = None, environments_dir: str = "environments"
@@ -42,63 +205,46 @@ class PerformanceTestRunner:
 
         # If using test-data directory, override the config to use the right path
         if environments_dir == "environments/test-data":
-            from ..environments.config import EnvironmentConfig
-
-            class TestEnvironmentConfig(EnvironmentConfig):
-                def load_environment(self, environment: str) -> Dict[str, Any]:
-                    """Load configuration for a test environment."""
-                    logger.info(f"Loading test environment configuration for: {environment}")
-
-                    # Look in test-data directory structure
-                    env_file = self.project_dir / "environments" / "test-data" / environment / f".env.{environment}"
-                    if not env_file.exists():
-                        raise FileNotFoundError(f"Test environment file not found: {env_file}")
-
-                    self.env_vars = self._parse_env_file(env_file)
-
-                    # Load docker-compose configuration
-                    compose_file = (
-                        self.project_dir
-                        / "environments"
-                        / "test-data"
-                        / environment
-                        / f"docker-compose.{environment}.yml"
-                    )
-                    if not compose_file.exists():
-                        raise FileNotFoundError(f"Test docker compose file not found: {compose_file}")
-
-                    self.compose_config = self._parse_compose_file(compose_file)
-
-                    # Extract service configurations
-                    self.service_configs = self._extract_service_configs()
-
-                    # Return combined configuration
-                    return {
-                        "environment": environment,
-                        "env_vars": self.env_vars,
-                        "compose_config": self.compose_config,
-                        "service_configs": self.service_configs,
-                        **self.env_vars,  # Include all env vars at top level for backward compatibility
-                    }
-
             self.environment_manager.config = TestEnvironmentConfig(self.project_dir)
 
         # Initialize monitoring with comprehensive event capture
         self.event_monitor = ContainerEventMonitor(capture_all_events=True)
-        self.health_watcher = HealthCheckWatcher()
+        self.docker_client = _connect_docker_api()
+        self.health_watcher = HealthCheckWatcher(docker_client=self.docker_client)
         self.performance_collector = PerformanceCollector(self.output_dir)
 
         # Current test run directory (set when test starts)
         self.current_run_dir: Optional[Path] = None
 
+        # Log collector, created on first use and pointed at each new run directory
+        self.log_collector: Optional[ContainerLogCollector] = None
+
+        # Background file writes, joined before the next iteration and at the end of each test
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="perf-io")
+        self._pending_io: List[Future] = []
+
+        # Wall-clock time and perf_counter reading taken together at the start of the current iteration
+        self._clock_anchor: Tuple[datetime, float] = (datetime.now(), time.perf_counter())
+
+        # Parsed environment configs keyed by environment, with the file mtimes they were parsed from
+        self._env_config_cache: Dict[str, Tuple[Tuple[Optional[int], ...], Dict[str, Any]]] = {}
+
+        # (config, expected, persistent) container names derived from the cached config above
+        self._container_names_cache: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...], Tuple[str, ...]]] = {}
+
         # Test configuration
         self.test_config = {
             "startup_timeout": 20,  # 20 seconds (user requirement)
             "shutdown_timeout": 30,  # 30 seconds
-            "health_check_interval": 2.0,  # 2 seconds
+            "health_check_interval_min": 0.05,  # First poll after 50ms, doubling while nothing changes
+            "health_check_interval_max": 2.0,  # 2 seconds
             "warmup_iterations": 1,
             "test_iterations": 3,
             "cooldown_time": 10,  # 10 seconds between tests
+            "collect_logs": True,  # Stop, collect logs, then destroy; False tears down in one compose call
+            "max_parallel_envs": None,  # Concurrent environments in parallel mode; None uses half the CPUs
+            "summary_values": True,  # Keep per-iteration timings in summaries alongside min/max/average
+            "pretty_json": os.environ.get("UNIFIED_PRETTY_JSON") == "1",  # Indent saved results and metadata
         }
 
         # Setup monitoring callbacks
@@ -109,14 +255,59 @@ class PerformanceTestRunner:
 
         # Event monitor callback
         def on_container_event(event):
-            logger.debug(f"Container event: {event}")
+            logger.debug("Container event: %s", event)
+
+            # Forward Docker health events so health waits wake without waiting for the next poll
+            if event.action == "health_status" and event.container_name in self.event_monitor.tracked_containers:
+                self.health_watcher.update_status(event.container_name, event.health_status)
 
         # Health watcher callback
         def on_health_change(health_status):
-            logger.debug(f"Health change: {health_status}")
+            logger.debug("Health change: %s", health_status)
 
         self.event_monitor.add_event_callback(on_container_event)
-        self.health_watcher.add_health_callback(on_health_change)
+
+        # The health callback only logs, so skip the per-change call unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            self.health_watcher.add_health_callback(on_health_change)
+
+    def close(self) -> None:
+        """Stop the Docker events subscription and health monitoring.
+
+        The background I/O pool and Docker client are shared with parallel workers
+        and are only released when the runner is used as a context manager.
+        """
+        self._wait_for_pending_io()
+        self.event_monitor.stop_monitoring()
+        self.health_watcher.stop_monitoring()
+
+    def __enter__(self) -> "PerformanceTestRunner":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Stop monitoring, finish background writes and release the Docker client."""
+        self.close()
+        self._io_pool.shutdown(wait=True)
+        if self.docker_client is not None:
+            self.docker_client.close()
+
+    def _submit_io(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run a file write in the background.
+
+        Args:
+            fn: Function performing the write
+            *args: Arguments for ``fn``
+        """
+        self._pending_io.append(self._io_pool.submit(fn, *args))
+
+    def _wait_for_pending_io(self) -> None:
+        """Wait for background file writes and log any that failed."""
+        pending, self._pending_io = self._pending_io, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Background write failed: {e}")
 
     def configure_test(self, **kwargs) -> None:
         """Configure test parameters.
@@ -140,9 +331,8 @@ class PerformanceTestRunner:
         run_dir_name = f"test-run-{environment_name}-{timestamp}"
         run_dir = self.output_dir / run_dir_name
 
-        # Create directory structure
-        run_dir.mkdir(parents=True, exist_ok=True)
-        (run_dir / "container-logs").mkdir(exist_ok=True)
+        # Create directory structure (makedirs creates run_dir on the way to container-logs)
+        os.makedirs(run_dir / "container-logs", exist_ok=True)
 
         logger.info(f"Created test run directory: {run_dir}")
         return run_dir
@@ -162,8 +352,8 @@ class PerformanceTestRunner:
         """
         iterations: int = iterations or self.test_config["test_iterations"]
 
-        logger.info(f"Starting performance test for environment: {environment_name}")
-        logger.info(f"Test iterations: {iterations}, Warmup: {include_warmup}")
+        logger.info("Starting performance test for environment: %s", environment_name)
+        logger.info("Test iterations: %s, Warmup: %s", iterations, include_warmup)
 
         # Validate environment exists
         if environment_name not in self.environment_manager.list_environments():
@@ -172,6 +362,9 @@ class PerformanceTestRunner:
         # Create timestamped run directory
         self.current_run_dir = self._create_test_run_directory(environment_name)
 
+        # Each iteration is appended here as it finishes, so an interrupted run keeps its completed iterations
+        iterations_file = self.current_run_dir / _METADATA_FILES["iterations"]
+
         # Initialize test results
         test_results: Dict[str, Any] = {
             "environment": environment_name,
@@ -189,26 +382,28 @@ class PerformanceTestRunner:
                 logger.info("Running warmup iteration...")
                 warmup_result = self._run_single_iteration(environment_name, "warmup")
                 test_results["warmup_result"] = warmup_result
+                append_json_line(iterations_file, warmup_result)
 
                 # Cooldown after warmup
-                time.sleep(self.test_config["cooldown_time"])
+                self._wait_for_cooldown(environment_name)
 
             # Run test iterations
             for i in range(iterations):
-                logger.info(f"Running test iteration {i + 1}/{iterations}")
+                logger.info("Running test iteration %s/%s", i + 1, iterations)
 
                 iteration_result = self._run_single_iteration(environment_name, f"iteration_{i + 1}")
                 test_results["results"].append(iteration_result)
+                append_json_line(iterations_file, iteration_result)
 
                 # Cooldown between iterations (except last)
                 if i < iterations - 1:
-                    time.sleep(self.test_config["cooldown_time"])
+                    self._wait_for_cooldown(environment_name)
 
             # Calculate summary statistics
             test_results["summary"] = self._calculate_test_summary(test_results["results"])
             test_results["end_time"] = datetime.now()
 
-            logger.info(f"Performance test completed for {environment_name}")
+            logger.info("Performance test completed for %s", environment_name)
             return test_results
 
         except Exception as e:
@@ -217,6 +412,10 @@ class PerformanceTestRunner:
             test_results["end_time"] = datetime.now()
             return test_results
 
+        finally:
+            # Make sure every log and event file of this test is on disk before returning
+            self._wait_for_pending_io()
+
     def _run_single_iteration(self, environment_name: str, iteration_name: str) -> Dict[str, Any]:
         """Run a single test iteration.
 
@@ -227,24 +426,31 @@ class PerformanceTestRunner:
         Returns:
             Iteration results
         """
+        # Durations are measured with perf_counter; wall-clock times are derived from this anchor
         iteration_start = datetime.now()
+        self._clock_anchor = (iteration_start, time.perf_counter())
 
-        logger.info(f"Starting iteration: {iteration_name}")
+        logger.info("Starting iteration: %s", iteration_name)
 
         # Get environment configuration to determine containers
-        env_config = self.environment_manager.config.load_environment(environment_name)
-        expected_containers = self._get_expected_containers(env_config, environment_name)
-        persistent_containers = self._get_persistent_containers(env_config, environment_name)
+        env_config = self._load_environment_config(environment_name)
+        expected_containers, persistent_containers = self._classify_containers(env_config, environment_name)
 
         # Setup monitoring for all containers (for events) but only wait for persistent ones
         self._setup_container_monitoring(expected_containers)
 
+        # Previous iteration's background writes may still be reading the monitors
+        self._wait_for_pending_io()
+
         # Clear previous monitoring data
         self.event_monitor.clear_events()
         self.health_watcher.clear_history()
+        self.health_watcher.min_check_interval = self.test_config["health_check_interval_min"]
+        self.health_watcher.check_interval = self.test_config["health_check_interval_max"]
 
-        # Start monitoring
-        self.event_monitor.start_monitoring()
+        # Start monitoring; the Docker events subscription is kept open across iterations
+        if not self.event_monitor.monitoring:
+            self.event_monitor.start_monitoring()
         self.health_watcher.start_monitoring()
 
         startup_performance = {}
@@ -258,11 +464,11 @@ class PerformanceTestRunner:
 
         try:
             # Start environment
-            startup_start = time.time()
+            startup_start = time.perf_counter()
             startup_result = self.environment_manager.start_environment(
                 environment_name, timeout=int(self.test_config["startup_timeout"])
             )
-            startup_end = time.time()
+            startup_end = time.perf_counter()
             startup_time: float = startup_end - startup_start
 
             if not startup_result.get("success", False):
@@ -270,8 +476,9 @@ class PerformanceTestRunner:
 
             startup_success = True
 
-            # Wait a moment for containers to be created and health monitoring to start
-            time.sleep(1)
+            # Wait for the create events of all containers before setting up health monitoring
+            if not self.event_monitor.wait_for_events(expected_containers, "create", timeout=5):
+                logger.debug(f"Not all create events observed for {environment_name}")
 
             # Re-setup health monitoring for containers that now exist
             try:
@@ -288,131 +495,162 @@ class PerformanceTestRunner:
 
             # Keep monitoring running through shutdown - don't stop yet
 
-            # Collect startup performance data (monitoring still running)
-            try:
-                startup_performance = self._collect_startup_performance(
-                    environment_name, expected_containers, startup_start, startup_end
-                )
-            except Exception as e:
-                logger.warning(f"Performance data collection failed: {e}")
-                startup_performance = {}
+            # Collect startup performance data (monitoring still running), unless health monitoring failed
+            # and there is nothing to collect; the final collection still ingests every event
+            if persistent_containers and not healthy_times:
+                logger.warning(f"Skipping startup performance collection for {environment_name}: no health data")
+            else:
+                try:
+                    startup_performance = self._collect_startup_performance(
+                        environment_name, expected_containers, startup_start, startup_end
+                    )
+                except Exception as e:
+                    logger.warning(f"Performance data collection failed: {e}")
+                    startup_performance = {}
 
         except Exception as e:
             error_message = str(e)
             logger.error(f"Startup phase failed for iteration {iteration_name}: {e}")
 
         finally:
-            # NEW LIFECYCLE: stop → collect logs → destroy → monitoring stops
+            # NEW LIFECYCLE: stop → collect logs → destroy → monitoring stops (one teardown call without logs)
             log_collection_results = {}
 
-            try:
-                # Step 1: Stop containers only (don't destroy yet) - monitoring still running
-                logger.info(f"Step 1: Stopping containers for {environment_name}")
-                shutdown_start = time.time()
-                shutdown_result = self.environment_manager.stop_containers_only(environment_name)
-                shutdown_end = time.time()
-                shutdown_time: float = shutdown_end - shutdown_start
-
-                if shutdown_result.get("success", False):
-                    shutdown_success = True
-                    logger.info(f"Containers for {environment_name} stopped successfully")
-                else:
-                    logger.warning(f"Container stop had issues: {shutdown_result.get('message', 'Unknown error')}")
-
-            except Exception as e:
-                logger.error(f"Container stop failed for iteration {iteration_name}: {e}")
-
-            try:
-                # Step 2: Collect container logs (containers stopped but not destroyed)
-                logger.info(f"Step 2: Collecting container logs for {environment_name}")
-
-                # Create log collector for this test run
-                if self.current_run_dir is None:
-                    raise ValueError("Test run directory not initialized")
-                log_collector = ContainerLogCollector(self.current_run_dir)
-
-                # Collect logs from all expected containers
-                log_collection_results = log_collector.collect_container_logs(expected_containers)
-                system_info = log_collector.collect_system_info()
-
-                logger.info(f"Container logs collected to {self.current_run_dir / 'container-logs'}")
+            if self.test_config["collect_logs"]:
+                try:
+                    # Step 1: Stop containers only (don't destroy yet) - monitoring still running
+                    logger.info("Step 1: Stopping containers for %s", environment_name)
+                    shutdown_start = time.perf_counter()
+                    shutdown_result = self.environment_manager.stop_containers_only(environment_name)
+                    shutdown_end = time.perf_counter()
+                    shutdown_time: float = shutdown_end - shutdown_start
+
+                    if shutdown_result.get("success", False):
+                        shutdown_success = True
+                        logger.info("Containers for %s stopped successfully", environment_name)
+                    else:
+                        logger.warning(f"Container stop had issues: {shutdown_result.get('message', 'Unknown error')}")
+
+                except Exception as e:
+                    logger.error(f"Container stop failed for iteration {iteration_name}: {e}")
 
-            except Exception as e:
-                logger.error(f"Log collection failed for iteration {iteration_name}: {e}")
-                log_collection_results = {}
-                system_info = {}
+                try:
+                    # Step 2: Collect container logs (containers stopped but not destroyed)
+                    logger.info("Step 2: Collecting container logs for %s", environment_name)
+
+                    # Point the log collector at this test run
+                    if self.current_run_dir is None:
+                        raise ValueError("Test run directory not initialized")
+                    if self.log_collector is None:
+                        self.log_collector = ContainerLogCollector(
+                            self.current_run_dir, docker_client=self.docker_client
+                        )
+                    else:
+                        self.log_collector.set_output_dir(self.current_run_dir)
+                    log_collector = self.log_collector
+
+                    # Collect logs from all expected containers with a single compose logs call
+                    log_collection_results = log_collector.collect_container_logs_batched(expected_containers)
+                    system_info = log_collector.collect_system_info()
+
+                    logger.info("Container logs collected to %s", self.current_run_dir / "container-logs")
+
+                except Exception as e:
+                    logger.error(f"Log collection failed for iteration {iteration_name}: {e}")
+                    log_collection_results = {}
+                    system_info = {}
 
-            try:
-                # Step 2.5: Collect server logs from /data/logs volume (before volumes are destroyed)
-                logger.info(f"Step 2.5: Collecting server logs from /data/logs volume for {environment_name}")
+                try:
+                    # Step 2.5: Collect server logs from /data/logs volume (before volumes are destroyed)
+                    logger.info("Step 2.5: Collecting server logs from /data/logs volume for %s", environment_name)
+
+                    # Use the same log collector to collect server logs
+                    server_logs_result = log_collector.collect_server_logs(environment_name)
+
+                    if server_logs_result["success"]:
+                        logger.info(
+                            "Server logs collected: %s files (%s bytes)",
+                            server_logs_result["files_collected"],
+                            server_logs_result["total_size"],
+                        )
+                    else:
+                        logger.warning(f"Server logs collection failed: {server_logs_result['error']}")
+
+                    # Save combined summary with both container and server logs in the background
+                    self._submit_io(
+                        log_collector.save_collection_summary, log_collection_results, system_info, server_logs_result
+                    )
 
-                # Use the same log collector to collect server logs
-                server_logs_result = log_collector.collect_server_logs(environment_name)
+                except Exception as e:
+                    logger.error(f"Server log collection failed for iteration {iteration_name}: {e}")
+                    server_logs_result = {
+                        "success": False,
+                        "error": str(e),
+                        "collection_dir": None,
+                        "files_collected": 0,
+                        "total_size": 0,
+                        "volume_name": f"logs-{environment_name}",
+                    }
+                    # Save summary with just container logs
+                    try:
+                        self._submit_io(
+                            log_collector.save_collection_summary,
+                            log_collection_results,
+                            system_info,
+                            server_logs_result,
+                        )
+                    except:
+                        logger.error("Failed to save log collection summary")
 
-                if server_logs_result["success"]:
-                    logger.info(
-                        f"Server logs collected: {server_logs_result['files_collected']} files ({server_logs_result['total_size']} bytes)"
+                try:
+                    # Step 3: Destroy containers and cleanup volumes (monitoring still running)
+                    logger.info("Step 3: Destroying containers and volumes for %s", environment_name)
+                    cleanup_result = self.environment_manager.remove_containers_and_volumes(
+                        environment_name, remove_volumes=True
                     )
-                else:
-                    logger.warning(f"Server logs collection failed: {server_logs_result['error']}")
 
-                # Save combined summary with both container and server logs
-                summary_file = log_collector.save_collection_summary(
-                    log_collection_results, system_info, server_logs_result
-                )
-
-                logger.info(f"Combined log collection summary saved to {summary_file}")
+                    if cleanup_result.get("success", False):
+                        cleanup_success = True
+                        logger.info("Environment %s destroyed successfully", environment_name)
+                    else:
+                        logger.warning(f"Cleanup had issues: {cleanup_result.get('message', 'Unknown error')}")
 
-            except Exception as e:
-                logger.error(f"Server log collection failed for iteration {iteration_name}: {e}")
-                server_logs_result = {
-                    "success": False,
-                    "error": str(e),
-                    "collection_dir": None,
-                    "files_collected": 0,
-                    "total_size": 0,
-                    "volume_name": f"logs-{environment_name}",
-                }
-                # Save summary with just container logs
+                except Exception as e:
+                    logger.error(f"Cleanup failed for iteration {iteration_name}: {e}")
+            else:
                 try:
-                    summary_file = log_collector.save_collection_summary(
-                        log_collection_results, system_info, server_logs_result
+                    # Without log collection nothing needs the stopped containers: stop and destroy in one call
+                    logger.info("Tearing down %s (log collection disabled)", environment_name)
+                    shutdown_start = time.perf_counter()
+                    teardown_result = self.environment_manager.teardown(
+                        environment_name, remove_volumes=True, timeout=int(self.test_config["shutdown_timeout"])
                     )
-                except:
-                    logger.error("Failed to save log collection summary")
+                    shutdown_end = time.perf_counter()
+                    shutdown_time = shutdown_end - shutdown_start
 
-            try:
-                # Step 3: Destroy containers and cleanup volumes (monitoring still running)
-                logger.info(f"Step 3: Destroying containers and volumes for {environment_name}")
-                cleanup_result = self.environment_manager.remove_containers_and_volumes(
-                    environment_name, remove_volumes=True
-                )
-
-                if cleanup_result.get("success", False):
-                    cleanup_success = True
-                    logger.info(f"Environment {environment_name} destroyed successfully")
-                else:
-                    logger.warning(f"Cleanup had issues: {cleanup_result.get('message', 'Unknown error')}")
+                    if teardown_result.get("success", False):
+                        shutdown_success = cleanup_success = True
+                        logger.info("Environment %s torn down successfully", environment_name)
+                    else:
+                        logger.warning(f"Teardown had issues: {teardown_result.get('message', 'Unknown error')}")
 
-            except Exception as e:
-                logger.error(f"Cleanup failed for iteration {iteration_name}: {e}")
+                except Exception as e:
+                    logger.error(f"Teardown failed for iteration {iteration_name}: {e}")
 
             # Step 4: Wait for final events and stop monitoring
             logger.info("Step 4: Stopping monitoring and collecting final data")
-            time.sleep(2)  # Allow final events to be captured
+            self.event_monitor.wait_for_idle(0.2, timeout=2)  # Allow final events to be captured
 
             # Save complete event log to run directory
             try:
                 if self.current_run_dir is None:
                     raise ValueError("Test run directory not initialized")
                 events_log_file = self.current_run_dir / "full-events.log"
-                self.event_monitor.save_full_event_log(events_log_file)
-                logger.info(f"Complete event log saved to {events_log_file}")
+                self._submit_io(self.event_monitor.save_full_event_log, events_log_file)
             except Exception as e:
                 logger.warning(f"Failed to save complete event log: {e}")
 
-            # NOW stop monitoring and collect final data
-            self.event_monitor.stop_monitoring()
+            # NOW stop health monitoring and collect final data (events stay subscribed until close())
             self.health_watcher.stop_monitoring()
 
             # Collect final performance data including shutdown events
@@ -434,7 +672,7 @@ class PerformanceTestRunner:
         iteration_result = {
             "iteration": iteration_name,
             "start_time": iteration_start,
-            "end_time": datetime.now(),
+            "end_time": self._wall_clock(time.perf_counter()),
             "startup_time": startup_time,
             "shutdown_time": shutdown_time,
             "healthy_times": healthy_times,
@@ -453,54 +691,129 @@ class PerformanceTestRunner:
 
         return iteration_result
 
-    def _get_expected_containers(self, env_config: Dict[str, Any], environment_name: str) -> List[str]:
-        """Get list of expected containers for an environment.
+    def _wall_clock(self, perf_counter_value: float) -> datetime:
+        """Convert a ``time.perf_counter()`` reading from this iteration to wall-clock time.
+
+        Args:
+            perf_counter_value: Value returned by ``time.perf_counter()``
+
+        Returns:
+            Corresponding local datetime
+        """
+        anchor_time, anchor_counter = self._clock_anchor
+        return anchor_time + timedelta(seconds=perf_counter_value - anchor_counter)
+
+    def _load_environment_config(self, environment_name: str) -> Dict[str, Any]:
+        """Load an environment's configuration, reusing the parsed result while its files are unchanged.
 
         Args:
-            env_config: Environment configuration
             environment_name: Environment name
 
         Returns:
-            List of expected container names
+            Environment configuration as returned by ``load_environment``
         """
-        expected_containers = []
+        files = self.environment_manager.get_environment_files(environment_name)
+        mtimes = tuple(self._mtime_ns(files[key]) for key in ("env_file", "compose_file"))
 
-        # Extract from compose configuration
-        compose_config = env_config.get("compose_config", {})
-        services = compose_config.get("services", {})
+        cached = self._env_config_cache.get(environment_name)
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
 
-        for service_name in services.keys():
-            # Generate expected container name
-            container_name = f"{service_name}-{environment_name}"
-            expected_containers.append(container_name)
+        env_config = self.environment_manager.config.load_environment(environment_name)
+        self._env_config_cache[environment_name] = (mtimes, env_config)
+        return env_config
+
+    @staticmethod
+    def _mtime_ns(path: Optional[Path]) -> Optional[int]:
+        """Return a file's modification time in nanoseconds, or None if it is missing."""
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-        return expected_containers
+    def _wait_for_cooldown(self, environment_name: str) -> None:
+        """Wait until no containers of an environment remain, up to ``cooldown_time``.
 
-    def _get_persistent_containers(self, env_config: Dict[str, Any], environment_name: str) -> List[str]:
-        """Get list of persistent containers that should have health checks.
+        Args:
+            environment_name: Environment name
+        """
+        deadline = time.monotonic() + self.test_config["cooldown_time"]
+        name_filter = f"-{environment_name}$"
+        cmd = ["docker", "ps", "-aq", "--filter", f"name={name_filter}"]
+        delay = 0.1
+
+        while True:
+            try:
+                if self.docker_client is not None:
+                    if not self.docker_client.containers(all=True, quiet=True, filters={"name": name_filter}):
+                        return
+                else:
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                    if result.returncode == 0 and not result.stdout.strip():
+                        return
+            except Exception as e:
+                logger.debug(f"Cooldown check failed for {environment_name}: {e}")
+
+            # Check often right after teardown, then back off up to once a second
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+    def _classify_containers(self, env_config: Dict[str, Any], environment_name: str) -> Tuple[List[str], List[str]]:
+        """Get the expected and persistent containers of an environment in one pass.
 
         Args:
             env_config: Environment configuration
             environment_name: Environment name
 
         Returns:
-            List of persistent container names (excludes one-time containers)
+            Tuple of (all expected container names, persistent container names that
+            should have health checks, i.e. excluding one-time containers)
         """
-        persistent_containers = []
+        # The config cache hands back the same object while the files are unchanged
+        cached = self._container_names_cache.get(environment_name)
+        if cached is None or cached[0] is not env_config:
+            services = env_config.get("compose_config", {}).get("services", {})
+
+            expected_containers = tuple(f"{service_name}-{environment_name}" for service_name in services)
+            persistent_containers = tuple(
+                container_name
+                for container_name, service_name in zip(expected_containers, services)
+                if service_name not in _ONE_TIME_SERVICES
+            )
+            cached = (env_config, expected_containers, persistent_containers)
+            self._container_names_cache[environment_name] = cached
 
-        # Extract from compose configuration
-        compose_config = env_config.get("compose_config", {})
-        services = compose_config.get("services", {})
+        # Callers get their own lists
+        return list(cached[1]), list(cached[2])
+
+    def _get_expected_containers(self, env_config: Dict[str, Any], environment_name: str) -> List[str]:
+        """Get list of expected containers for an environment.
+
+        Args:
+            env_config: Environment configuration
+            environment_name: Environment name
+
+        Returns:
+            List of expected container names
+        """
+        return self._classify_containers(env_config, environment_name)[0]
 
-        # One-time containers that exit after completing their work
-        one_time_services = {"volume-setup", "flyway"}
+    def _get_persistent_containers(self, env_config: Dict[str, Any], environment_name: str) -> List[str]:
+        """Get list of persistent containers that should have health checks.
 
-        for service_name in services.keys():
-            if service_name not in one_time_services:
-                container_name = f"{service_name}-{environment_name}"
-                persistent_containers.append(container_name)
+        Args:
+            env_config: Environment configuration
+            environment_name: Environment name
 
-        return persistent_containers
+        Returns:
+            List of persistent container names (excludes one-time containers)
+        """
+        return self._classify_containers(env_config, environment_name)[1]
 
     def _setup_container_monitoring(self, container_names: List[str]) -> None:
         """Setup monitoring for specific containers.
@@ -508,13 +821,11 @@ class PerformanceTestRunner:
         Args:
             container_names: List of container names to monitor
         """
-        # Clear existing filters
-        self.event_monitor.container_filters.clear()
+        # Replace existing filters
+        self.event_monitor.set_container_filters(container_names)
         self.health_watcher.monitored_containers.clear()
 
-        # Add new filters
         for container_name in container_names:
-            self.event_monitor.add_container_filter(container_name)
             self.health_watcher.add_container(container_name)
 
     def _setup_health_monitoring_for_running_containers(self, container_names: List[str]) -> None:
@@ -539,20 +850,26 @@ class PerformanceTestRunner:
         Returns:
             Dictionary mapping container names to healthy times
         """
-        healthy_times = {}
+        if not container_names:
+            return {}
+
         timeout = self.test_config["startup_timeout"]
+        start_time = time.perf_counter()
+        deadline = start_time + timeout
 
-        for container_name in container_names:
-            start_time = time.time()
+        def wait_for_container(container_name: str) -> float:
+            # Share one deadline so threads that start late do not extend the overall wait
+            if self.health_watcher.wait_for_healthy(container_name, max(0.0, deadline - time.perf_counter())):
+                healthy_time = time.perf_counter() - start_time
+                logger.info(f"Container {container_name} became healthy in {healthy_time:.2f}s")
+                return healthy_time
 
-            if self.health_watcher.wait_for_healthy(container_name, timeout):
-                healthy_times[container_name] = time.time() - start_time
-                logger.info(f"Container {container_name} became healthy in {healthy_times[container_name]:.2f}s")
-            else:
-                logger.warning(f"Container {container_name} did not become healthy within timeout")
-                healthy_times[container_name] = timeout
+            logger.warning(f"Container {container_name} did not become healthy within timeout")
+            return timeout
 
-        return healthy_times
+        # Wait on all containers concurrently so total wall time is bounded by the slowest one
+        with ThreadPoolExecutor(max_workers=len(container_names)) as executor:
+            return dict(zip(container_names, executor.map(wait_for_container, container_names)))
 
     def _collect_startup_performance(
         self, environment_name: str, container_names: List[str], startup_start: float, startup_end: float
@@ -562,8 +879,8 @@ class PerformanceTestRunner:
         Args:
             environment_name: Environment name
             container_names: List of container names
-            startup_start: Startup start timestamp
-            startup_end: Startup end timestamp
+            startup_start: Startup start ``time.perf_counter()`` reading
+            startup_end: Startup end ``time.perf_counter()`` reading
 
         Returns:
             Performance data dictionary
@@ -572,7 +889,7 @@ class PerformanceTestRunner:
         env_metrics = self.performance_collector.add_environment(environment_name)
         if env_metrics is None:
             raise ValueError(f"Failed to create environment metrics for {environment_name}")
-        env_metrics.start_time = datetime.fromtimestamp(startup_start)
+        env_metrics.start_time = self._wall_clock(startup_start)
 
         # Collect data from event monitor
         self.performance_collector.collect_from_event_monitor(self.event_monitor, environment_name)
@@ -580,8 +897,8 @@ class PerformanceTestRunner:
         # Collect data from health watcher
         self.performance_collector.collect_from_health_watcher(self.health_watcher, environment_name)
 
-        # Finalize environment metrics
-        self.performance_collector.finalize_environment(environment_name)
+        # Aggregate for the startup snapshot; the environment is finalized once at the end of the iteration
+        env_metrics.calculate_environment_metrics()
 
         # Get environment metrics
         env_metrics = self.performance_collector.environments.get(environment_name)
@@ -589,7 +906,9 @@ class PerformanceTestRunner:
         if env_metrics:
             return {
                 "environment_metrics": env_metrics.environment_metrics,
-                "container_metrics": {name: container.metrics for name, container in env_metrics.containers.items()},
+                "container_metrics": {
+                    name: container.to_dict()["metrics"] for name, container in env_metrics.containers.items()
+                },
             }
 
         return {}
@@ -602,16 +921,16 @@ class PerformanceTestRunner:
         Args:
             environment_name: Environment name
             container_names: List of container names
-            shutdown_start: Shutdown start timestamp
-            shutdown_end: Shutdown end timestamp
+            shutdown_start: Shutdown start ``time.perf_counter()`` reading
+            shutdown_end: Shutdown end ``time.perf_counter()`` reading
 
         Returns:
             Final performance data dictionary
         """
-        # Collect final data from event monitor (includes shutdown events)
+        # Collect events since the startup snapshot (includes shutdown events)
         self.performance_collector.collect_from_event_monitor(self.event_monitor, environment_name)
 
-        # Collect final data from health watcher (includes final health states)
+        # Collect health records since the startup snapshot (includes final health states)
         self.performance_collector.collect_from_health_watcher(self.health_watcher, environment_name)
 
         # Finalize environment metrics with all data
@@ -624,7 +943,7 @@ class PerformanceTestRunner:
             return {
                 "final_environment_metrics": env_metrics.environment_metrics,
                 "final_container_metrics": {
-                    name: container.metrics for name, container in env_metrics.containers.items()
+                    name: container.to_dict()["metrics"] for name, container in env_metrics.containers.items()
                 },
             }
 
@@ -642,60 +961,51 @@ class PerformanceTestRunner:
         if not results:
             return {}
 
-        # Filter successful iterations
-        successful_results = [r for r in results if r.get("startup_success", False)]
+        # Gather all timings of the successful iterations in a single pass
+        startup_times: List[float] = []
+        shutdown_times: List[float] = []
+        container_healthy_times: DefaultDict[str, List[float]] = defaultdict(list)
+        for result in results:
+            if not result.get("startup_success", False):
+                continue
+            startup_times.append(result["startup_time"])
+            if "shutdown_time" in result:
+                shutdown_times.append(result["shutdown_time"])
+            for container_name, healthy_time in result.get("healthy_times", {}).items():
+                container_healthy_times[container_name].append(healthy_time)
 
-        if not successful_results:
+        if not startup_times:
             return {"error": "No successful iterations"}
 
-        # Calculate startup time statistics
-        startup_times = [r["startup_time"] for r in successful_results]
-        shutdown_times = [r["shutdown_time"] for r in successful_results if "shutdown_time" in r]
-
+        include_values = self.test_config["summary_values"]
         summary = {
             "total_iterations": len(results),
-            "successful_iterations": len(successful_results),
-            "success_rate": len(successful_results) / len(results),
-            "startup_times": {
-                "min": min(startup_times),
-                "max": max(startup_times),
-                "average": sum(startup_times) / len(startup_times),
-                "values": startup_times,
-            },
+            "successful_iterations": len(startup_times),
+            "success_rate": len(startup_times) / len(results),
+            "startup_times": _summarize_times(startup_times, include_values),
         }
 
         if shutdown_times:
-            summary["shutdown_times"] = {
-                "min": min(shutdown_times),
-                "max": max(shutdown_times),
-                "average": sum(shutdown_times) / len(shutdown_times),
-                "values": shutdown_times,
-            }
-
-        # Calculate per-container healthy time statistics
-        container_healthy_times: Dict[str, List[float]] = {}
-        for result in successful_results:
-            for container_name, healthy_time in result.get("healthy_times", {}).items():
-                if container_name not in container_healthy_times:
-                    container_healthy_times[container_name] = []
-                container_healthy_times[container_name].append(healthy_time)
+            summary["shutdown_times"] = _summarize_times(shutdown_times, include_values)
 
-        summary["container_healthy_times"] = {}
-        for container_name, times in container_healthy_times.items():
-            summary["container_healthy_times"][container_name] = {
-                "min": min(times),
-                "max": max(times),
-                "average": sum(times) / len(times),
-                "values": times,
-            }
+        # Per-container healthy time statistics
+        summary["container_healthy_times"] = {
+            container_name: _summarize_times(times, include_values)
+            for container_name, times in container_healthy_times.items()
+        }
 
         return summary
 
-    def run_all_environments_test(self, environment_filter: Optional[List[str]] = None) -> Dict[str, Any]:
+    def run_all_environments_test(
+        self, environment_filter: Optional[List[str]] = None, parallel: bool = False
+    ) -> Dict[str, Any]:
         """Run performance tests for all environments.
 
         Args:
             environment_filter: Optional list of environment names to test
+            parallel: Test environments concurrently instead of one after another. Each
+                environment gets its own monitors filtered to its containers, so the
+                full event log only contains that environment's events.
 
         Returns:
             Combined test results
@@ -707,7 +1017,7 @@ class PerformanceTestRunner:
         else:
             test_environments = all_environments
 
-        logger.info(f"Running performance tests for environments: {test_environments}")
+        logger.info("Running performance tests for environments: %s", test_environments)
 
         combined_results = {
             "start_time": datetime.now(),
@@ -716,23 +1026,24 @@ class PerformanceTestRunner:
             "summary": {},
         }
 
-        # Run tests for each environment
-        for env_name in test_environments:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Testing environment: {env_name}")
-            logger.info(f"{'='*60}")
+        if parallel and len(test_environments) > 1:
+            combined_results["results"] = self._run_environments_parallel(test_environments)
+        else:
+            # Run tests for each environment
+            for env_name in test_environments:
+                logger.info("\n%s\nTesting environment: %s\n%s", _BANNER, env_name, _BANNER)
 
-            try:
-                env_results = self.run_environment_performance_test(env_name)
-                combined_results["results"][env_name] = env_results
+                try:
+                    env_results = self.run_environment_performance_test(env_name)
+                    combined_results["results"][env_name] = env_results
 
-                # Add cooldown between environments
-                if env_name != test_environments[-1]:
-                    time.sleep(self.test_config["cooldown_time"])
+                    # Add cooldown between environments
+                    if env_name != test_environments[-1]:
+                        self._wait_for_cooldown(env_name)
 
-            except Exception as e:
-                logger.error(f"Failed to test environment {env_name}: {e}")
-                combined_results["results"][env_name] = {"error": str(e), "environment": env_name}
+                except Exception as e:
+                    logger.error(f"Failed to test environment {env_name}: {e}")
+                    combined_results["results"][env_name] = {"error": str(e), "environment": env_name}
 
         combined_results["end_time"] = datetime.now()
 
@@ -741,6 +1052,79 @@ class PerformanceTestRunner:
 
         return combined_results
 
+    def _run_environments_parallel(self, environments: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run environment tests concurrently, one worker runner per environment.
+
+        Args:
+            environments: Environment names to test
+
+        Returns:
+            Test results keyed by environment name, in the order given
+        """
+        max_parallel = self.test_config["max_parallel_envs"] or (os.cpu_count() or 2) // 2
+        max_workers = max(1, min(len(environments), max_parallel))
+        logger.info("Testing %s environments in parallel with %s workers", len(environments), max_workers)
+
+        workers = {env_name: self._create_worker() for env_name in environments}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(worker._run_and_close, env_name): env_name for env_name, worker in workers.items()
+            }
+            for future in as_completed(futures):
+                env_name = futures[future]
+                try:
+                    results[env_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to test environment {env_name}: {e}")
+                    results[env_name] = {"error": str(e), "environment": env_name}
+
+                # Fold the worker's metrics back into this runner's collector
+                env_metrics = workers[env_name].performance_collector.environments.get(env_name)
+                if env_metrics is not None:
+                    self.performance_collector.environments[env_name] = env_metrics
+
+        return {env_name: results[env_name] for env_name in environments}
+
+    def _run_and_close(self, environment_name: str) -> Dict[str, Any]:
+        """Run an environment test and release this runner's monitors afterwards.
+
+        Args:
+            environment_name: Name of the environment to test
+
+        Returns:
+            Test results dictionary
+        """
+        try:
+            return self.run_environment_performance_test(environment_name)
+        finally:
+            self.close()
+
+    def _create_worker(self) -> "PerformanceTestRunner":
+        """Create a runner sharing this runner's configuration but with its own mutable state.
+
+        Returns:
+            Worker runner for testing a single environment
+        """
+        worker = copy.copy(self)
+        worker.test_config = dict(self.test_config)
+        worker.current_run_dir = None
+        worker.log_collector = None
+        worker._pending_io = []
+
+        # EnvironmentConfig keeps the last loaded environment on the instance
+        worker.environment_manager = copy.copy(self.environment_manager)
+        worker.environment_manager.config = copy.copy(self.environment_manager.config)
+
+        # Filtered monitors so concurrent environments do not see each other's events
+        worker.event_monitor = ContainerEventMonitor()
+        worker.health_watcher = HealthCheckWatcher(docker_client=self.docker_client)
+        worker.performance_collector = PerformanceCollector(self.output_dir)
+        worker._setup_monitoring()
+
+        return worker
+
     def _calculate_overall_summary(self, environment_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate overall summary across all environments.
 
@@ -750,41 +1134,44 @@ class PerformanceTestRunner:
         Returns:
             Overall summary
         """
-        summary = {
-            "total_environments": len(environment_results),
-            "successful_environments": 0,
-            "failed_environments": 0,
-            "average_startup_times": {},
-            "slowest_environment": None,
-            "fastest_environment": None,
-        }
-
-        successful_envs = []
+        successful = 0
+        failed = 0
         avg_startup_times = {}
 
         for env_name, env_result in environment_results.items():
             if env_result.get("error"):
-                summary["failed_environments"] += 1
+                failed += 1
                 continue
 
-            summary["successful_environments"] += 1
-            successful_envs.append(env_name)
-
-            # Get average startup time
-            env_summary = env_result.get("summary", {})
-            startup_times = env_summary.get("startup_times", {})
-            avg_startup = startup_times.get("average")
+            successful += 1
 
-            if avg_startup:
+            # Get average startup time (0.0 is a valid average)
+            env_summary = env_result.get("summary") or _EMPTY
+            avg_startup = (env_summary.get("startup_times") or _EMPTY).get("average")
+            if avg_startup is not None:
                 avg_startup_times[env_name] = avg_startup
 
+        summary = {
+            "total_environments": len(environment_results),
+            "successful_environments": successful,
+            "failed_environments": failed,
+            "average_startup_times": {},
+            "slowest_environment": None,
+            "fastest_environment": None,
+        }
+
         # Find slowest and fastest environments
         if avg_startup_times:
-            slowest_env = max(avg_startup_times, key=avg_startup_times.get)
-            fastest_env = min(avg_startup_times, key=avg_startup_times.get)
-
-            summary["slowest_environment"] = {"name": slowest_env, "startup_time": avg_startup_times[slowest_env]}
-            summary["fastest_environment"] = {"name": fastest_env, "startup_time": avg_startup_times[fastest_env]}
+            items = iter(avg_startup_times.items())
+            slowest_env, slowest_time = fastest_env, fastest_time = next(items)
+            for env_name, avg_startup in items:
+                if avg_startup > slowest_time:
+                    slowest_env, slowest_time = env_name, avg_startup
+                elif avg_startup < fastest_time:
+                    fastest_env, fastest_time = env_name, avg_startup
+
+            summary["slowest_environment"] = {"name": slowest_env, "startup_time": slowest_time}
+            summary["fastest_environment"] = {"name": fastest_env, "startup_time": fastest_time}
             summary["average_startup_times"] = avg_startup_times
 
         return summary
@@ -805,60 +1192,44 @@ class PerformanceTestRunner:
         if not filename:
             filename = "test-results.json"
 
-        # Save performance collector data to run directory
-        if self.current_run_dir:
-            # Update performance collector output directory for this run
-            original_output_dir = self.performance_collector.output_dir
-            self.performance_collector.output_dir = self.current_run_dir
-            collector_file = self.performance_collector.save_performance_data("performance-metrics.json")
-            self.performance_collector.output_dir = original_output_dir
-        else:
-            collector_file = self.performance_collector.save_performance_data()
-
-        # Save test results to run directory
+        pretty = self.test_config["pretty_json"]
+        metrics_filename = _METADATA_FILES["performance_metrics"] if self.current_run_dir else None
         results_file = save_dir / filename
 
-        # Convert datetime objects to ISO format
-        serialized_results = self._serialize_datetime_objects(results)
+        # The three files are independent: write metrics and metadata alongside encoding results here. The pool
+        # is local, so saving works after the runner is closed, and leaving the block waits for every write even
+        # if the results write fails
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="perf-save") as pool:
+            collector_future = pool.submit(
+                self.performance_collector.save_performance_data, metrics_filename, output_dir=self.current_run_dir
+            )
+            writes: List[Future] = [collector_future]
+
+            # Create test metadata file
+            if self.current_run_dir:
+                metadata_file = self.current_run_dir / "test-metadata.json"
+                metadata = {
+                    "test_run_timestamp": datetime.now().isoformat(),
+                    "environment": results.get("environment", "unknown"),
+                    "test_configuration": self.test_config,
+                    "run_directory": str(self.current_run_dir),
+                    "files": {"test_results": filename, **_METADATA_FILES},
+                }
+                writes.append(pool.submit(write_json, metadata_file, metadata, pretty))
 
-        import json
+            # Save test results to run directory
+            write_json(results_file, results, pretty)
 
-        with open(results_file, "w") as f:
-            json.dump(serialized_results, f, indent=2)
+        # Surface write errors to the caller, as the sequential writes did
+        for future in writes:
+            future.result()
+        collector_file = collector_future.result()
 
-        # Create test metadata file
         if self.current_run_dir:
-            metadata_file = self.current_run_dir / "test-metadata.json"
-            metadata = {
-                "test_run_timestamp": datetime.now().isoformat(),
-                "environment": results.get("environment", "unknown"),
-                "test_configuration": self.test_config,
-                "run_directory": str(self.current_run_dir),
-                "files": {
-                    "test_results": filename,
-                    "performance_metrics": "performance-metrics.json",
-                    "full_events": "full-events.log",
-                    "container_logs_dir": "container-logs/",
-                    "log_collection_summary": "container-logs/log-collection-summary.json",
-                },
-            }
-
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
-
             logger.info(f"Test metadata saved to {metadata_file}")
-
         logger.info(f"Test results saved to {results_file}")
+        if not pretty:
+            logger.info(f"Results are compact JSON; view with: python -m json.tool {results_file}")
         logger.info(f"Performance data saved to {collector_file}")
 
         return results_file
-
-    def _serialize_datetime_objects(self, obj):
-        """Recursively serialize datetime objects to ISO format strings."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, dict):
-            return {key: self._serialize_datetime_objects(value) for key, value in obj.items()}
-        if isinstance(obj, list):
-            return [self._serialize_datetime_objects(item) for item in obj]
-        return obj
@@ -7,29 +7,30 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from unified.performance.test_runner import PerformanceTestRunner
-
 
 def main():
-    project_dir = Path(__file__).parent
-    runner = PerformanceTestRunner(project_dir)
-
-    # Configure for quick test
-    runner.configure_test(
-        test_iterations=1, warmup_iterations=0, startup_timeout=120, shutdown_timeout=30, cooldown_time=5
-    )
-
     print("Starting performance test...")
 
-    # Run performance test
-    results = runner.run_environment_performance_test("dev", iterations=1, include_warmup=False)
-
-    print("Performance test completed!")
-    print(f"Results available in: {runner.current_run_dir}")
+    # Imported here so the message above appears before the runner's import graph is loaded
+    from unified.performance.test_runner import PerformanceTestRunner
 
-    # Save results and generate performance metrics
-    results_file = runner.save_results(results)
-    print(f"Results saved to: {results_file}")
+    project_dir = Path(__file__).parent
+    # The context manager stops the runner's docker events subscription on exit
+    with PerformanceTestRunner(project_dir) as runner:
+        # Configure for quick test
+        runner.configure_test(
+            test_iterations=1, warmup_iterations=0, startup_timeout=120, shutdown_timeout=30, cooldown_time=5
+        )
+
+        # Run performance test
+        results = runner.run_environment_performance_test("dev", iterations=1, include_warmup=False)
+
+        print("Performance test completed!")
+        print(f"Results available in: {runner.current_run_dir}")
+
+        # Save results and generate performance metrics
+        results_file = runner.save_results(results)
+        print(f"Results saved to: {results_file}")
 
     # Print summary
     if "error" not in results:
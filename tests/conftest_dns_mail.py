@@ -5,19 +5,153 @@ This module provides fixtures and configuration for DNS mail integration testing
 
 import logging
 import os
+import re
+import socket
 import subprocess
 import time
-from typing import Any, Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:  # pragma: no cover - optional dependency
+    dns = None  # type: ignore[assignment, unused-ignore]
+
 logger = logging.getLogger(__name__)
 
+# Mail record formats, compiled once instead of re-checking substrings per validation
+_SPF_RE = re.compile(r"v=spf1\b(?=.*[~-]all\b)")
+_SPF_IP4_RE = re.compile(r"\bip4:([^\s/]+)")
+_DMARC_RE = re.compile(r"v=DMARC1\b(?=.*\bp=)(?=.*\brua=mailto:)")
+_MX_RE = re.compile(r"\d+\s+(\S+?)\.?(?:\s|$)")
 
-@pytest.fixture(scope="session")
-def dns_mail_config() -> Dict[str, Any]:
-    """Configuration for DNS mail integration tests."""
-    config = {
+# dig exit status when no server replied
+_DIG_NO_REPLY = 9
+
+# Seconds to wait on a DNS query before hedging it with a parallel attempt
+DNS_HEDGE_DELAY = 0.5
+
+# Seconds a DNS availability result is reused across collections
+DNS_PROBE_CACHE_SECONDS = 60
+
+# Seconds a DNS and mail readiness result is shared between workers and re-runs
+DNS_READY_CACHE_SECONDS = 30
+
+# Why DNS mail tests should be skipped (None when the services are ready), set after collection
+_SERVICES_SKIP_REASON = pytest.StashKey[Optional[str]]()
+
+# Header (ID 0, recursion desired, one question) and a root-label A question
+_ROOT_QUERY = b"\x00\x00\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00" + b"\x00\x00\x01\x00\x01"
+
+
+class DNSLookupError(RuntimeError):
+    """A DNS query that failed, and whether trying again could succeed."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def make_dns_resolver(dns_mail_config: Dict[str, Any]) -> Optional[Any]:
+    """Build a resolver that queries the configured DNS server directly.
+
+    Args:
+        dns_mail_config: DNS mail integration test configuration
+
+    Returns:
+        ``dns.resolver.Resolver`` reused for every query, or None when dnspython is
+        not installed and queries fall back to the ``dig`` CLI
+    """
+    if dns is None:
+        return None
+
+    resolver = dns.resolver.Resolver(configure=False)
+    # dnspython only accepts addresses, while DNS_SERVER may be a host name such as localhost
+    resolver.nameservers = [socket.gethostbyname(dns_mail_config["dns_server"])]
+    resolver.port = dns_mail_config["dns_port"]
+    return resolver
+
+
+def lookup_dns(
+    dns_mail_config: Dict[str, Any], resolver: Optional[Any], domain: str, record_type: str, timeout: float = 5
+) -> List[str]:
+    """Query the configured DNS server once.
+
+    Args:
+        dns_mail_config: DNS mail integration test configuration
+        resolver: Resolver from ``make_dns_resolver``, or None to use ``dig``
+        domain: Domain name to query
+        record_type: DNS record type
+        timeout: Query timeout in seconds
+
+    Returns:
+        Records in ``dig +short`` form; empty when the name or record does not exist or
+        the server answered with an error rcode such as SERVFAIL or REFUSED, as ``dig``
+        reports those replies
+
+    Raises:
+        DNSLookupError: If no reply arrived; only timeouts and transport errors are retryable
+    """
+    if resolver is not None:
+        try:
+            answers = resolver.resolve(domain, record_type, lifetime=timeout, raise_on_no_answer=False)
+        except dns.resolver.NXDOMAIN:
+            return []
+        except dns.exception.Timeout as e:
+            msg = f"DNS query timed out: {e}"
+            raise DNSLookupError(msg) from e
+        except dns.resolver.NoNameservers as e:
+            # Each error is (server, tcp, port, rcode text or exception, response). A response means the server
+            # replied, e.g. with SERVFAIL or REFUSED, which dig also reports as an empty answer; only transport
+            # errors, such as a server that is not listening yet, leave it unset
+            errors = getattr(e, "kwargs", {}).get("errors") or []
+            if errors and all(len(error) > 4 and error[4] is not None for error in errors):
+                return []
+            msg = f"DNS query failed: {e}"
+            raise DNSLookupError(msg) from e
+        except dns.exception.DNSException as e:
+            # Malformed queries and other protocol errors give the same answer on every attempt
+            msg = f"DNS query failed: {e}"
+            raise DNSLookupError(msg, retryable=False) from e
+        return [rdata.to_text() for rdata in answers]
+
+    try:
+        result = subprocess.run(
+            [
+                "dig",
+                f"@{dns_mail_config['dns_server']}",
+                "-p",
+                str(dns_mail_config["dns_port"]),
+                domain,
+                record_type,
+                "+short",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except OSError as e:
+        msg = f"Could not run dig: {e}"
+        raise DNSLookupError(msg, retryable=False) from e
+
+    if result.returncode != 0:
+        # dig exits with 9 when the server did not reply; other codes are usage or internal errors
+        msg = f"dig failed: {result.stderr.strip()}"
+        raise DNSLookupError(msg, retryable=result.returncode == _DIG_NO_REPLY)
+
+    return [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
+
+
+def load_dns_mail_config() -> Dict[str, Any]:
+    """Build the DNS mail integration test configuration from the environment.
+
+    Returns:
+        Configuration dictionary
+    """
+    return {
         "mail_domain": os.environ.get("MAIL_DOMAIN", "lab.sethlakowske.com"),
         "mail_server_ip": os.environ.get("MAIL_SERVER_IP", "192.168.0.156"),
         "dns_server": os.environ.get("DNS_SERVER", "localhost"),
@@ -27,168 +161,202 @@ def dns_mail_config() -> Dict[str, Any]:
         "retry_delay": 2,
     }
 
-    logger.info(f"DNS mail integration test configuration: {config}")
-    return config
-
-
-@pytest.fixture(scope="session")
-def ensure_services_running(dns_mail_config):
-    """Ensure DNS and mail services are running before tests."""
-    logger.info("Checking if DNS and mail services are running...")
 
-    # Check DNS service
-    dns_ok = False
-    for attempt in range(dns_mail_config["retry_attempts"]):
-        try:
-            result = subprocess.run(
-                [
-                    "dig",
-                    f"@{dns_mail_config['dns_server']}",
-                    "-p",
-                    str(dns_mail_config["dns_port"]),
-                    ".",
-                    "NS",
-                    "+short",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                dns_ok = True
-                break
-            logger.warning(f"DNS check attempt {attempt + 1} failed: {result.stderr}")
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"DNS check attempt {attempt + 1} timed out")
-        except Exception as e:
-            logger.warning(f"DNS check attempt {attempt + 1} error: {e}")
-
-        if attempt < dns_mail_config["retry_attempts"] - 1:
-            time.sleep(dns_mail_config["retry_delay"])
-
-    if not dns_ok:
-        pytest.skip("DNS server not running - skipping DNS integration tests")
-
-    # Check mail domain DNS resolution
-    mail_domain_ok = False
-    for attempt in range(dns_mail_config["retry_attempts"]):
-        try:
-            result = subprocess.run(
-                [
-                    "dig",
-                    f"@{dns_mail_config['dns_server']}",
-                    "-p",
-                    str(dns_mail_config["dns_port"]),
-                    dns_mail_config["mail_domain"],
-                    "A",
-                    "+short",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                mail_domain_ok = True
-                break
-            logger.warning(f"Mail domain check attempt {attempt + 1} failed: {result.stderr}")
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Mail domain check attempt {attempt + 1} timed out")
-        except Exception as e:
-            logger.warning(f"Mail domain check attempt {attempt + 1} error: {e}")
-
-        if attempt < dns_mail_config["retry_attempts"] - 1:
-            time.sleep(dns_mail_config["retry_delay"])
-
-    if not mail_domain_ok:
-        pytest.skip(f"Mail domain {dns_mail_config['mail_domain']} not resolvable - skipping tests")
+def check_services_running(dns_mail_config: Dict[str, Any]) -> Optional[str]:
+    """Check that the DNS server answers and resolves the mail domain.
 
-    logger.info("DNS and mail services verified as running")
-    return True
+    Args:
+        dns_mail_config: DNS mail integration test configuration
 
+    Returns:
+        None if the services are ready, otherwise the reason to skip the tests
+    """
+    logger.info("Checking if DNS and mail services are running...")
 
-@pytest.fixture
-def dns_query_helper(dns_mail_config):
-    """Helper function for DNS queries."""
+    try:
+        resolver = make_dns_resolver(dns_mail_config)
+    except OSError as e:
+        return f"DNS server {dns_mail_config['dns_server']} not resolvable ({e}) - skipping DNS integration tests"
 
-    def query_dns(domain: str, record_type: str, timeout: int = 5):
-        """Query DNS with retry logic."""
+    def probe(label: str, domain: str, record_type: str) -> Optional[List[str]]:
+        """Query until the server answers, returning None if it never does."""
         for attempt in range(dns_mail_config["retry_attempts"]):
             try:
-                result = subprocess.run(
-                    [
-                        "dig",
-                        f"@{dns_mail_config['dns_server']}",
-                        "-p",
-                        str(dns_mail_config["dns_port"]),
-                        domain,
-                        record_type,
-                        "+short",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-
-                if result.returncode == 0:
-                    records = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-                    return True, records
-                logger.warning(f"DNS query attempt {attempt + 1} failed for {domain} {record_type}: {result.stderr}")
-
+                # Once the server answers, a missing record will not appear by retrying
+                return lookup_dns(dns_mail_config, resolver, domain, record_type)
             except subprocess.TimeoutExpired:
-                logger.warning(f"DNS query attempt {attempt + 1} timed out for {domain} {record_type}")
+                logger.warning("%s check attempt %d timed out", label, attempt + 1)
+            except DNSLookupError as e:
+                logger.warning("%s check attempt %d error: %s", label, attempt + 1, e)
+                if not e.retryable:
+                    break
             except Exception as e:
-                logger.warning(f"DNS query attempt {attempt + 1} error for {domain} {record_type}: {e}")
+                logger.warning("%s check attempt %d error: %s", label, attempt + 1, e)
 
             if attempt < dns_mail_config["retry_attempts"] - 1:
                 time.sleep(dns_mail_config["retry_delay"])
 
-        return False, []
+        return None
 
-    return query_dns
+    # Both probes wait on the same server, so run them (and their retries) side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        dns_probe = pool.submit(probe, "DNS", ".", "NS")
+        mail_probe = pool.submit(probe, "Mail domain", dns_mail_config["mail_domain"], "A")
 
+        if dns_probe.result() is None:
+            return "DNS server not running - skipping DNS integration tests"
 
-@pytest.fixture
-def mail_record_validator():
+        if not mail_probe.result():
+            return f"Mail domain {dns_mail_config['mail_domain']} not resolvable - skipping tests"
+
+    logger.info("DNS and mail services verified as running")
+    return None
+
+
+@pytest.fixture(scope="session")
+def dns_mail_config() -> Dict[str, Any]:
+    """Configuration for DNS mail integration tests."""
+    config = load_dns_mail_config()
+
+    logger.info("DNS mail integration test configuration: %s", config)
+    return config
+
+
+@pytest.fixture(scope="session")
+def dns_mail_resolver(dns_mail_config):
+    """Resolver shared by every DNS query in the session (None when dnspython is missing)."""
+    return make_dns_resolver(dns_mail_config)
+
+
+@pytest.fixture(scope="session")
+def ensure_services_running(pytestconfig):
+    """Ensure DNS and mail services are running before tests.
+
+    The check itself runs once after collection, in ``pytest_collection_modifyitems``.
+    """
+    skip_reason = pytestconfig.stash.get(_SERVICES_SKIP_REASON, None)
+    if skip_reason:
+        pytest.skip(skip_reason)
+
+    return True
+
+
+@pytest.fixture(scope="session")
+def dns_query_helper(dns_mail_config, dns_mail_resolver, pytestconfig):
+    """Helper function for DNS queries.
+
+    Successful answers are remembered for the session, since many tests look up the
+    same records; pass ``--no-dns-cache`` to query the server every time.
+    """
+    use_cache = not pytestconfig.getoption("no_dns_cache")
+    answers: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+    retry_attempts = dns_mail_config["retry_attempts"]
+    # Attempts already running cannot be cancelled, so leave room for a previous query's stragglers
+    pool = ThreadPoolExecutor(max_workers=retry_attempts * 2, thread_name_prefix="dns-query")
+
+    def query_dns(domain: str, record_type: str, timeout: int = 5):
+        """Query DNS with retry logic.
+
+        An attempt that has not answered within ``DNS_HEDGE_DELAY`` seconds is hedged
+        with another one while it keeps waiting, and the first answer wins. Attempts
+        that fail outright are retried after ``retry_delay`` as before.
+        """
+        key = (domain, record_type)
+        if use_cache and key in answers:
+            return True, list(answers[key])
+
+        pending: Dict[Future, int] = {}
+        try:
+            for attempt in range(retry_attempts):
+                future = pool.submit(lookup_dns, dns_mail_config, dns_mail_resolver, domain, record_type, timeout)
+                pending[future] = attempt
+                last = attempt == retry_attempts - 1
+
+                while pending:
+                    done, _ = wait(pending, timeout=None if last else DNS_HEDGE_DELAY, return_when=FIRST_COMPLETED)
+                    if not done:
+                        # Still waiting on the server: hedge with another attempt
+                        break
+
+                    for future in done:
+                        failed_attempt = pending.pop(future)
+                        try:
+                            records = future.result()
+                        except subprocess.TimeoutExpired:
+                            logger.warning(
+                                "DNS query attempt %d timed out for %s %s", failed_attempt + 1, domain, record_type
+                            )
+                        except DNSLookupError as e:
+                            logger.warning(
+                                "DNS query attempt %d error for %s %s: %s", failed_attempt + 1, domain, record_type, e
+                            )
+                            if not e.retryable:
+                                return False, []
+                        except Exception as e:
+                            logger.warning(
+                                "DNS query attempt %d error for %s %s: %s", failed_attempt + 1, domain, record_type, e
+                            )
+                        else:
+                            if use_cache:
+                                answers[key] = tuple(records)
+                            return True, records
+
+                    if not last:
+                        # An attempt failed outright; give the server a moment before replacing it
+                        time.sleep(dns_mail_config["retry_delay"])
+                        break
+
+            return False, []
+        finally:
+            # Hedges still queued would otherwise hold workers the next query's attempts need
+            for straggler in pending:
+                straggler.cancel()
+
+    yield query_dns
+
+    pool.shutdown(wait=False)
+
+
+def validate_spf(record: str, expected_ip: str) -> bool:
+    """Validate SPF record."""
+    record = record.strip('"')
+    return _SPF_RE.match(record) is not None and expected_ip in _SPF_IP4_RE.findall(record)
+
+
+def validate_dmarc(record: str, domain: str) -> bool:
+    """Validate DMARC record."""
+    record = record.strip('"')
+    return _DMARC_RE.match(record) is not None and domain in record
+
+
+def validate_dkim(record: str) -> bool:
+    """Validate DKIM record."""
+    record = record.strip('"')
+    # Should have substantial public key; v= must come first, and each later search resumes where the last matched
+    if len(record) <= 100 or not record.startswith("v=DKIM1"):
+        return False
+    key_type = record.find("k=rsa")
+    return key_type >= 0 and record.find("p=", key_type) >= 0
+
+
+def validate_mx(record: str, domain: str) -> bool:
+    """Validate MX record."""
+    match = _MX_RE.match(record)
+    return match is not None and match.group(1).endswith(domain)
+
+
+class MailRecordValidator:
     """Validator for mail-related DNS records."""
 
-    class MailRecordValidator:
-        @staticmethod
-        def validate_spf(record: str, expected_ip: str) -> bool:
-            """Validate SPF record."""
-            record = record.strip('"')
-            return (
-                record.startswith("v=spf1")
-                and f"ip4:{expected_ip}" in record
-                and ("~all" in record or "-all" in record)
-            )
-
-        @staticmethod
-        def validate_dmarc(record: str, domain: str) -> bool:
-            """Validate DMARC record."""
-            record = record.strip('"')
-            return record.startswith("v=DMARC1") and "p=" in record and "rua=mailto:" in record and domain in record
-
-        @staticmethod
-        def validate_dkim(record: str) -> bool:
-            """Validate DKIM record."""
-            record = record.strip('"')
-            return (
-                "v=DKIM1" in record
-                and "k=rsa" in record
-                and "p=" in record
-                and len(record) > 100  # Should have substantial public key
-            )
-
-        @staticmethod
-        def validate_mx(record: str, domain: str) -> bool:
-            """Validate MX record."""
-            parts = record.split()
-            return len(parts) >= 2 and parts[0].isdigit() and parts[1].rstrip(".").endswith(domain)
+    validate_spf = staticmethod(validate_spf)
+    validate_dmarc = staticmethod(validate_dmarc)
+    validate_dkim = staticmethod(validate_dkim)
+    validate_mx = staticmethod(validate_mx)
 
+
+@pytest.fixture(scope="session")
+def mail_record_validator():
+    """Validator for mail-related DNS records."""
     return MailRecordValidator()
 
 
@@ -197,37 +365,53 @@ def performance_tracker():
     """Track DNS query performance."""
 
     class PerformanceTracker:
-        def __init__(self):
-            self.measurements = {}
+        def __init__(self, track_all: bool = False):
+            # Running aggregates keep the statistics O(1); per-query times are only kept on request.
+            # Times are integer nanoseconds from the monotonic clock and converted to seconds when reported.
+            self.count = 0
+            self.total_ns = 0
+            self.slowest_ns: Tuple[Optional[str], int] = (None, 0)
+            self.measurements: Optional[Dict[str, float]] = {} if track_all else None
 
         def measure_query(self, query_func, domain: str, record_type: str):
             """Measure DNS query performance."""
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             success, records = query_func(domain, record_type)
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
-            query_time = end_time - start_time
+            query_time = elapsed_ns / 1e9
             key = f"{domain}:{record_type}"
-            self.measurements[key] = query_time
+            self.count += 1
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.slowest_ns[1]:
+                self.slowest_ns = (key, elapsed_ns)
+            if self.measurements is not None:
+                self.measurements[key] = query_time
 
             return success, records, query_time
 
         def get_average_time(self) -> float:
             """Get average query time."""
-            if not self.measurements:
-                return 0.0
-            return sum(self.measurements.values()) / len(self.measurements)
+            return self.total_ns / self.count / 1e9 if self.count else 0.0
 
         def get_slowest_query(self) -> tuple:
             """Get slowest query."""
-            if not self.measurements:
-                return None, 0.0
-            slowest = max(self.measurements.items(), key=lambda x: x[1])
-            return slowest[0], slowest[1]
+            key, elapsed_ns = self.slowest_ns
+            return key, elapsed_ns / 1e9
 
     return PerformanceTracker()
 
 
+def pytest_addoption(parser):
+    """Add command line options for DNS mail integration tests."""
+    parser.addoption(
+        "--no-dns-cache",
+        action="store_true",
+        default=False,
+        help="Query the DNS server for every lookup instead of reusing answers within the session",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest for DNS mail integration tests."""
     # Add custom markers
@@ -237,28 +421,90 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "requires_mail_server: mark test as requiring mail server")
 
 
+def _dns_server_responds(dns_server: str, dns_port: int) -> bool:
+    """Check that a DNS server answers a query.
+
+    Connecting a UDP socket only validates the address, so a minimal query for the
+    root zone is sent and any reply counts as the server being up.
+
+    Args:
+        dns_server: DNS server host
+        dns_port: DNS server port
+
+    Returns:
+        True if the server replied within a second
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(1)
+            sock.sendto(_ROOT_QUERY, (dns_server, dns_port))
+            sock.recvfrom(512)
+        return True
+    except OSError:
+        return False
+
+
+def _record_services_running(config) -> None:
+    """Check the DNS and mail services once for the whole run.
+
+    The outcome is shared through pytest's cache, so pytest-xdist workers and quick
+    re-runs reuse a recent result instead of probing again.
+
+    Args:
+        config: pytest configuration the result is stashed on
+    """
+    dns_mail_config = load_dns_mail_config()
+
+    cache = getattr(config, "cache", None)
+    server = f"{dns_mail_config['dns_server']}:{dns_mail_config['dns_port']}"
+    cache_key = f"dns_mail/ready/{server}/{dns_mail_config['mail_domain']}"
+    cached = cache.get(cache_key, None) if cache is not None else None
+
+    if cached is not None and time.time() - cached["ts"] < DNS_READY_CACHE_SECONDS:
+        skip_reason = cached["skip_reason"]
+    else:
+        skip_reason = check_services_running(dns_mail_config)
+        if cache is not None:
+            cache.set(cache_key, {"skip_reason": skip_reason, "ts": time.time()})
+
+    config.stash[_SERVICES_SKIP_REASON] = skip_reason
+
+
+@pytest.hookimpl(trylast=True)
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection for DNS mail integration tests."""
+    """Modify test collection for DNS mail integration tests.
+
+    Runs after the other collection hooks, so tests deselected with ``-k`` or ``-m``
+    are no longer in ``items`` and cannot trigger a probe.
+    """
+    # Only probe for what the selected tests use, so runs narrowed with -k or paths stay free
+    if any("ensure_services_running" in item.fixturenames for item in items):
+        _record_services_running(config)
+
+    dns_items = [item for item in items if "dns_integration" in item.keywords or "requires_dns_server" in item.keywords]
+    if not dns_items:
+        return
+
     # Skip tests if DNS server not available
     dns_server = os.environ.get("DNS_SERVER", "localhost")
     dns_port = int(os.environ.get("DNS_PORT", "53"))
 
-    try:
-        import socket
+    # Re-collection (e.g. --lf) within a minute reuses the last answer from pytest's cache
+    cache = getattr(config, "cache", None)
+    cache_key = f"dns_mail/available/{dns_server}:{dns_port}"
+    cached = cache.get(cache_key, None) if cache is not None else None
 
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((dns_server, dns_port))
-        sock.close()
-        dns_available = result == 0
-    except Exception:
-        dns_available = False
+    if cached is not None and time.time() - cached["ts"] < DNS_PROBE_CACHE_SECONDS:
+        dns_available = cached["ok"]
+    else:
+        dns_available = _dns_server_responds(dns_server, dns_port)
+        if cache is not None:
+            cache.set(cache_key, {"ok": dns_available, "ts": time.time()})
 
     if not dns_available:
         skip_dns = pytest.mark.skip(reason="DNS server not available")
-        for item in items:
-            if "dns_integration" in item.keywords or "requires_dns_server" in item.keywords:
-                item.add_marker(skip_dns)
+        for item in dns_items:
+            item.add_marker(skip_dns)
 
 
 @pytest.fixture(scope="session", autouse=True)
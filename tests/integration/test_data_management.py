@@ -8,16 +8,68 @@ import json
 import logging
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pytest
 
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None  # type: ignore[assignment, unused-ignore]
+
+# The libyaml loader is much faster than the pure-Python one when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _parse_env_file(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from an environment file.
+
+    Results are cached by path and modification time, so repeated validations of an
+    unchanged file skip the read. The returned dictionary is shared and must not be modified.
+
+    Args:
+        path: Environment file path
+        mtime_ns: File modification time, part of the cache key
+
+    Returns:
+        Dictionary of environment variables
+    """
+    env_vars = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                if "=" in line:
+                    key, value = line.split("=", 1)
+                    env_vars[key] = value
+    return env_vars
+
+
+@lru_cache(maxsize=64)
+def _parse_compose_file(path: str, mtime_ns: int) -> Any:
+    """Parse a Docker Compose file.
+
+    Cached like ``_parse_env_file``; the returned data is shared and must not be modified.
+
+    Args:
+        path: Compose file path
+        mtime_ns: File modification time, part of the cache key
+
+    Returns:
+        Parsed YAML data
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 class TestDataManager:
     """Manages test data and validation for static environments."""
 
@@ -159,14 +211,7 @@ class TestDataManager:
         else:
             # Parse environment file
             try:
-                env_vars = {}
-                with env_file.open() as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            if "=" in line:
-                                key, value = line.split("=", 1)
-                                env_vars[key] = value
+                env_vars = _parse_env_file(str(env_file), env_file.stat().st_mtime_ns)
 
                 result["config"]["env_vars"] = env_vars
 
@@ -185,13 +230,12 @@ class TestDataManager:
         if not compose_file.exists():
             result["valid"] = False
             result["errors"].append(f"Docker Compose file not found: {compose_file}")
+        elif yaml is None:
+            result["warnings"].append("PyYAML not available for Docker Compose validation")
         else:
             # Basic YAML validation
             try:
-                import yaml
-
-                with compose_file.open() as f:
-                    compose_data = yaml.safe_load(f)
+                compose_data = _parse_compose_file(str(compose_file), compose_file.stat().st_mtime_ns)
 
                 result["config"]["compose"] = compose_data
 
@@ -201,8 +245,6 @@ class TestDataManager:
                 elif not compose_data["services"]:
                     result["errors"].append("Docker Compose file has empty 'services' section")
 
-            except ImportError:
-                result["warnings"].append("PyYAML not available for Docker Compose validation")
             except Exception as e:
                 result["valid"] = False
                 result["errors"].append(f"Error parsing Docker Compose file: {e}")
@@ -377,27 +419,36 @@ class TestDataManager:
         """
         result = {"success": True, "environment": env_name, "steps": [], "errors": []}
 
+        def list_names(command: List[str]) -> Optional[List[str]]:
+            """Run a docker listing command, returning None if it failed."""
+            proc = subprocess.run(command, capture_output=True, text=True, timeout=30, stdin=subprocess.DEVNULL)
+            if proc.returncode != 0:
+                return None
+            return [name.strip() for name in proc.stdout.split("\n") if name.strip()]
+
         try:
-            # Stop and remove containers
-            container_prefix = f"{env_name}-"
-            try:
-                # Get containers with the environment prefix
-                proc = subprocess.run(
-                    ["docker", "ps", "-a", "--filter", f"name={container_prefix}", "--format", "{{.Names}}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+            # List containers and volumes at the same time; volumes are only removed once their containers are gone
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                containers_future = pool.submit(
+                    list_names, ["docker", "ps", "-a", "--filter", f"name={env_name}-", "--format", "{{.Names}}"]
+                )
+                volumes_future = pool.submit(
+                    list_names, ["docker", "volume", "ls", "--filter", f"name={env_name}-", "--format", "{{.Name}}"]
                 )
 
-                if proc.returncode == 0:
-                    container_names = [name.strip() for name in proc.stdout.split("\n") if name.strip()]
+            # Stop and remove containers
+            try:
+                container_names = containers_future.result()
 
+                if container_names is not None:
                     if container_names:
-                        # Stop containers
-                        subprocess.run(["docker", "stop"] + container_names, capture_output=True, timeout=60)
-
-                        # Remove containers
-                        subprocess.run(["docker", "rm"] + container_names, capture_output=True, timeout=30)
+                        # Kill and remove in one command
+                        subprocess.run(
+                            ["docker", "rm", "-f", *container_names],
+                            capture_output=True,
+                            timeout=60,
+                            stdin=subprocess.DEVNULL,
+                        )
 
                         result["steps"].append(f"Removed {len(container_names)} containers")
                     else:
@@ -410,19 +461,16 @@ class TestDataManager:
 
             # Remove volumes
             try:
-                volume_prefix = f"{env_name}-"
-                proc = subprocess.run(
-                    ["docker", "volume", "ls", "--filter", f"name={volume_prefix}", "--format", "{{.Name}}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                if proc.returncode == 0:
-                    volume_names = [name.strip() for name in proc.stdout.split("\n") if name.strip()]
+                volume_names = volumes_future.result()
 
+                if volume_names is not None:
                     if volume_names:
-                        subprocess.run(["docker", "volume", "rm"] + volume_names, capture_output=True, timeout=30)
+                        subprocess.run(
+                            ["docker", "volume", "rm", *volume_names],
+                            capture_output=True,
+                            timeout=30,
+                            stdin=subprocess.DEVNULL,
+                        )
                         result["steps"].append(f"Removed {len(volume_names)} volumes")
                     else:
                         result["steps"].append("No volumes found to remove")
@@ -0,0 +1,98 @@
+"""Unit tests for waiting on Docker events.
+
+These tests push synthetic events through the monitor, so they do not require
+a Docker daemon.
+"""
+
+import threading
+import time
+
+from unified.performance.event_monitor import ContainerEvent, ContainerEventMonitor
+
+
+def make_event(action: str, name: str) -> ContainerEvent:
+    """Build a minimal container event."""
+    return ContainerEvent({"Type": "container", "Action": action, "Actor": {"Attributes": {"name": name}}})
+
+
+class TestContainerEvent:
+    """Test decoding Docker event JSON."""
+
+    def test_health_status_in_action(self):
+        """Test that the daemon's "health_status: <status>" action is split into action and status."""
+        event = make_event("health_status: healthy", "web-test")
+
+        assert event.action == "health_status"
+        assert event.health_status == "healthy"
+
+
+class TestContainerFilters:
+    """Test matching events against container name filters."""
+
+    def test_filters_match_substrings(self):
+        """Test that an event matches when any filter occurs in its container name."""
+        monitor = ContainerEventMonitor()
+        monitor.set_container_filters(["postgres-perf", "apache-perf"])
+
+        assert monitor._should_process_event(make_event("start", "postgres-perf"))
+        assert monitor._should_process_event(make_event("start", "unified-apache-perf-1"))
+        assert not monitor._should_process_event(make_event("start", "mail-perf"))
+
+    def test_replacing_filters(self):
+        """Test that replacing filters drops the old ones and tracks only the new names."""
+        monitor = ContainerEventMonitor()
+        monitor.add_container_filter("web-old")
+        monitor.set_container_filters(["web-new"])
+
+        assert not monitor._should_process_event(make_event("start", "web-old"))
+        assert monitor.tracked_containers == {"web-new"}
+
+
+class TestContainerEventMonitorWaits:
+    """Test event-driven waits on the monitor."""
+
+    def test_wait_for_events_wakes_when_all_containers_seen(self):
+        """Test that the wait returns once every container has the requested event."""
+        monitor = ContainerEventMonitor()
+        monitor._process_event(make_event("create", "web-test"))
+        timer = threading.Timer(0.05, monitor._process_event, args=(make_event("create", "db-test"),))
+
+        start = time.perf_counter()
+        timer.start()
+        try:
+            assert monitor.wait_for_events(["web-test", "db-test"], "create", timeout=5.0)
+        finally:
+            timer.cancel()
+
+        assert time.perf_counter() - start < 1.0
+
+    def test_wait_for_events_ignores_other_actions(self):
+        """Test that events with a different action do not satisfy the wait."""
+        monitor = ContainerEventMonitor()
+        monitor._process_event(make_event("start", "web-test"))
+
+        assert not monitor.wait_for_events(["web-test"], "create", timeout=0.05)
+
+    def test_wait_for_idle(self):
+        """Test idle detection relative to the last stored event."""
+        monitor = ContainerEventMonitor()
+        assert monitor.wait_for_idle(0.2, timeout=0.0)
+
+        monitor._process_event(make_event("destroy", "web-test"))
+        assert not monitor.wait_for_idle(0.5, timeout=0.05)
+        assert monitor.wait_for_idle(0.05, timeout=1.0)
+
+
+class TestSaveFullEventLog:
+    """Test writing the raw event log."""
+
+    def test_raw_events_are_written_one_per_line(self, tmp_path):
+        """Test that the header counts match the raw JSON lines written."""
+        monitor = ContainerEventMonitor(capture_all_events=True)
+        monitor.all_events_log.extend(['{"Action": "create"}', '{"Action": "start"}'])
+
+        output_path = monitor.save_full_event_log(tmp_path / "full-events.log")
+
+        lines = output_path.read_text().splitlines()
+        assert "# Total raw events: 2" in lines
+        assert lines[-2:] == ['{"Action": "create"}', '{"Action": "start"}']
@@ -0,0 +1,78 @@
+"""Unit tests for health check waiting.
+
+These tests feed health statuses into the watcher directly, so they do not
+require a Docker daemon.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from unified.performance.health_watcher import HealthCheckWatcher, HealthStatus
+
+
+class TestHealthCheckWatcherWaits:
+    """Test waiting on container health transitions."""
+
+    def test_wait_wakes_on_status_update(self):
+        """Test that a waiter returns as soon as a healthy status is reported."""
+        watcher = HealthCheckWatcher()
+        timer = threading.Timer(0.05, watcher.update_status, args=("web-test", HealthStatus.HEALTHY))
+
+        start = time.perf_counter()
+        timer.start()
+        try:
+            assert watcher.wait_for_healthy("web-test", timeout=5.0)
+        finally:
+            timer.cancel()
+
+        assert time.perf_counter() - start < 1.0
+        assert watcher.get_current_status("web-test") == HealthStatus.HEALTHY
+
+    def test_wait_times_out(self):
+        """Test that a waiter gives up when the target status never arrives."""
+        watcher = HealthCheckWatcher()
+        watcher.update_status("web-test", HealthStatus.STARTING)
+
+        assert not watcher.wait_for_healthy("web-test", timeout=0.05)
+
+    def test_repeated_status_is_recorded_once(self):
+        """Test that reporting the current status again does not add history."""
+        watcher = HealthCheckWatcher()
+        watcher.update_status("web-test", HealthStatus.STARTING)
+        watcher.update_status("web-test", HealthStatus.STARTING)
+        watcher.update_status("web-test", HealthStatus.HEALTHY)
+
+        assert [status.status for status in watcher.get_health_history("web-test")] == [
+            HealthStatus.STARTING,
+            HealthStatus.HEALTHY,
+        ]
+
+    def test_status_change_resets_poll_backoff(self):
+        """Test that the poll interval drops back to the minimum after a change."""
+        watcher = HealthCheckWatcher(check_interval=2.0, min_check_interval=0.05)
+        watcher._backoff = 2.0
+
+        watcher.update_status("web-test", HealthStatus.STARTING)
+
+        assert watcher._backoff == 0.05
+
+
+class TestHealthCheckWatcherPollBatch:
+    """Test batched health lookups through the docker CLI."""
+
+    def test_one_inspect_for_all_containers(self):
+        """Test that statuses are matched back to names by container ID prefix."""
+        watcher = HealthCheckWatcher()
+        output = "aaaaaaaaaaaa1111 healthy\nbbbbbbbbbbbb2222 \n"
+        containers = {"web-test": "aaaaaaaaaaaa", "worker-test": "bbbbbbbbbbbb", "gone-test": "cccccccccccc"}
+
+        with patch("subprocess.run", return_value=Mock(returncode=1, stdout=output, stderr="No such object")) as run:
+            statuses = watcher.poll_batch(containers)
+
+        run.assert_called_once()
+        assert statuses == {
+            "web-test": HealthStatus.HEALTHY,
+            "worker-test": HealthStatus.NONE,
+            "gone-test": HealthStatus.NONE,
+        }
@@ -0,0 +1,259 @@
+"""Unit tests for container log collection helpers.
+
+Docker calls are stubbed, so these tests do not require a Docker daemon.
+"""
+
+import subprocess
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from unified.performance import log_collector
+from unified.performance.log_collector import ContainerLogCollector
+
+
+def completed(stdout: str = "", returncode: int = 0) -> subprocess.CompletedProcess:
+    """Build the result of a stubbed docker CLI call."""
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+@pytest.fixture
+def docker_run(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub ``subprocess.run`` so docker CLI calls are answered by the test."""
+    run = Mock()
+    monkeypatch.setattr(subprocess, "run", run)
+    return run
+
+
+def docker_commands(run: Mock) -> List[List[str]]:
+    """Commands passed to the stubbed ``subprocess.run``, in call order."""
+    return [call.args[0] for call in run.call_args_list]
+
+
+class TestSplitComposeLogs:
+    """Test splitting combined ``docker compose logs`` output."""
+
+    def test_lines_are_grouped_by_container(self):
+        """Test that padded prefixes are stripped and lines keep their order."""
+        output = (
+            "web-test-env-1  | 2024-01-01T00:00:00Z starting nginx\n"
+            "db-test-env-1   | 2024-01-01T00:00:01Z database system is ready\n"
+            "web-test-env-1  | 2024-01-01T00:00:02Z GET /health | 200\n"
+        )
+
+        log_lines = ContainerLogCollector._split_compose_logs(output)
+
+        assert log_lines["web-test-env-1"] == [
+            "2024-01-01T00:00:00Z starting nginx\n",
+            "2024-01-01T00:00:02Z GET /health | 200\n",
+        ]
+        assert log_lines["db-test-env-1"] == ["2024-01-01T00:00:01Z database system is ready\n"]
+
+    def test_lines_without_prefix_are_ignored(self):
+        """Test that lines compose did not attribute to a container are skipped."""
+        log_lines = ContainerLogCollector._split_compose_logs("no prefix here\n\n")
+
+        assert dict(log_lines) == {}
+
+    def test_last_line_without_newline(self):
+        """Test that a final line without a trailing newline is kept."""
+        log_lines = ContainerLogCollector._split_compose_logs("web-test-env-1  | ready")
+
+        assert log_lines["web-test-env-1"] == ["ready"]
+
+
+class TestInspectLogPath:
+    """Test looking up ``.LogPath`` through the Docker API client."""
+
+    class NotFound(Exception):
+        """Stand-in for ``docker.errors.NotFound``."""
+
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """API client stub, with the docker SDK's NotFound error replaced by a local class."""
+        monkeypatch.setattr(log_collector, "docker", SimpleNamespace(errors=SimpleNamespace(NotFound=self.NotFound)))
+        return Mock()
+
+    def test_missing_container_is_not_found(self, tmp_path, client: Mock, docker_run: Mock):
+        """Test that a NotFound error reports the container as missing without asking the CLI."""
+        client.inspect_container.side_effect = self.NotFound("No such container: web-test")
+        collector = ContainerLogCollector(tmp_path, docker_client=client)
+
+        assert collector._inspect_log_path("web-test") is None
+        docker_run.assert_not_called()
+
+    def test_api_error_falls_back_to_cli(self, tmp_path, client: Mock, docker_run: Mock):
+        """Test that a daemon or connection error asks ``docker inspect`` instead of reporting a missing container."""
+        client.inspect_container.side_effect = ConnectionError("connection refused")
+        docker_run.return_value = completed("/var/lib/docker/containers/abc/abc-json.log\n")
+        collector = ContainerLogCollector(tmp_path, docker_client=client)
+
+        assert collector._inspect_log_path("web-test") == "/var/lib/docker/containers/abc/abc-json.log"
+        assert docker_commands(docker_run) == [["docker", "inspect", "--format", "{{.LogPath}}", "web-test"]]
+
+
+class TestBatchedCollection:
+    """Test collecting logs of one Compose project with a single ``docker compose logs`` call."""
+
+    CONTAINERS = ["web-test-env-1", "db-test-env-1"]
+    SAME_PROJECT = "/web-test-env-1 test-env\n/db-test-env-1 test-env\n"
+    COMPOSE_LOGS = (
+        "web-test-env-1  | 2024-01-01T00:00:00Z starting nginx\n"
+        "db-test-env-1   | 2024-01-01T00:00:01Z database system is ready\n"
+    )
+
+    @pytest.fixture
+    def collector(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> ContainerLogCollector:
+        """Collector writing plain log files, with per-container collection stubbed."""
+        collector = ContainerLogCollector(tmp_path, compress_logs=False)
+        fallback = Mock(return_value={"fallback": {"success": True}})
+        monkeypatch.setattr(collector, "collect_container_logs", fallback)
+        return collector
+
+    def test_single_project_is_collected_in_one_call(self, collector: ContainerLogCollector, docker_run: Mock):
+        """Test that one inspect and one compose logs call produce a log file per container."""
+        docker_run.side_effect = [completed(self.SAME_PROJECT), completed(self.COMPOSE_LOGS)]
+
+        results = collector.collect_container_logs_batched(self.CONTAINERS)
+
+        collector.collect_container_logs.assert_not_called()
+        commands = docker_commands(docker_run)
+        assert len(commands) == 2
+        assert commands[1][:4] == ["docker", "compose", "-p", "test-env"]
+        assert all(results[name]["success"] for name in self.CONTAINERS)
+        assert "starting nginx" in (collector.logs_dir / "web-test-env-1.log").read_text()
+        assert "database system is ready" in (collector.logs_dir / "db-test-env-1.log").read_text()
+
+    @pytest.mark.parametrize(
+        "inspect_output",
+        ["/web-test-env-1 test-env\n/db-test-env-1 other-env\n", "/web-test-env-1 \n/db-test-env-1 \n"],
+        ids=["mixed-projects", "unlabelled"],
+    )
+    def test_containers_outside_one_project_fall_back(
+        self, collector: ContainerLogCollector, docker_run: Mock, inspect_output: str
+    ):
+        """Test that containers from several or no Compose projects are collected one by one."""
+        docker_run.return_value = completed(inspect_output)
+
+        assert collector.collect_container_logs_batched(self.CONTAINERS) == {"fallback": {"success": True}}
+        collector.collect_container_logs.assert_called_once_with(self.CONTAINERS)
+        assert len(docker_commands(docker_run)) == 1
+
+    def test_failed_compose_logs_falls_back(self, collector: ContainerLogCollector, docker_run: Mock):
+        """Test that a non-zero ``docker compose logs`` exit code falls back to per-container collection."""
+        docker_run.side_effect = [completed(self.SAME_PROJECT), completed(self.COMPOSE_LOGS, returncode=1)]
+
+        assert collector.collect_container_logs_batched(self.CONTAINERS) == {"fallback": {"success": True}}
+        collector.collect_container_logs.assert_called_once_with(self.CONTAINERS)
+
+    def test_unattributable_output_falls_back(self, collector: ContainerLogCollector, docker_run: Mock):
+        """Test that output naming none of the containers falls back to per-container collection."""
+        other_logs = "web-1  | 2024-01-01T00:00:00Z starting nginx\n"
+        docker_run.side_effect = [completed(self.SAME_PROJECT), completed(other_logs)]
+
+        assert collector.collect_container_logs_batched(self.CONTAINERS) == {"fallback": {"success": True}}
+        collector.collect_container_logs.assert_called_once_with(self.CONTAINERS)
+
+
+class TestSetOutputDir:
+    """Test reusing a collector across test runs."""
+
+    def test_directories_follow_new_output_dir(self, tmp_path):
+        """Test that log directories are created under the new run directory."""
+        collector = ContainerLogCollector(tmp_path / "run-1")
+        collector.set_output_dir(tmp_path / "run-2")
+
+        assert collector.logs_dir == tmp_path / "run-2" / "container-logs"
+        assert collector.logs_dir.is_dir()
+        assert collector.server_logs_dir.is_dir()
+
+
+class TestCompressedLogs:
+    """Test writing container logs with zstandard compression."""
+
+    @pytest.fixture
+    def zstd(self):
+        """The zstandard module; compression is only enabled when it is installed."""
+        return pytest.importorskip("zstandard")
+
+    def test_compressed_file_decompresses_to_log_content(self, tmp_path, zstd):
+        """Test that the ``.log.zst`` file holds the header and logs unchanged."""
+        collector = ContainerLogCollector(tmp_path)
+        content = "# Container: web-test\n" + "GET /health 200\n" * 100
+
+        result = collector._write_log_file(collector.logs_dir / "web-test.log", content)
+
+        log_file = collector.logs_dir / "web-test.log.zst"
+        assert result["log_file"] == str(log_file)
+        assert result["compressed"] is True
+        with open(log_file, "rb") as f:
+            assert zstd.ZstdDecompressor().stream_reader(f).read().decode("utf-8") == content
+
+    def test_sizes_distinguish_disk_and_raw_bytes(self, tmp_path, zstd):
+        """Test that ``log_size`` is the on-disk size and ``uncompressed_size`` the raw length."""
+        collector = ContainerLogCollector(tmp_path)
+        content = "GET /health 200 ü\n" * 100
+
+        result = collector._write_log_file(collector.logs_dir / "web-test.log", content)
+
+        assert result["log_size"] == (collector.logs_dir / "web-test.log.zst").stat().st_size
+        assert result["uncompressed_size"] == len(content.encode("utf-8"))
+        assert result["log_size"] < result["uncompressed_size"]
+
+    def test_compression_can_be_disabled(self, tmp_path, zstd):
+        """Test that ``compress_logs=False`` writes a plain ``.log`` file."""
+        collector = ContainerLogCollector(tmp_path, compress_logs=False)
+        content = "GET /health 200\n"
+
+        result = collector._write_log_file(collector.logs_dir / "web-test.log", content)
+
+        log_file = collector.logs_dir / "web-test.log"
+        assert result["log_file"] == str(log_file)
+        assert result["compressed"] is False
+        assert log_file.read_text(encoding="utf-8") == content
+        assert result["log_size"] == result["uncompressed_size"] == len(content)
+        assert not (collector.logs_dir / "web-test.log.zst").exists()
+
+
+class TestEmptyLogShortcut:
+    """Test skipping ``docker logs`` for containers whose log file is empty."""
+
+    def test_empty_log_file_skips_docker_logs(self, tmp_path, docker_run: Mock):
+        """Test that an empty ``.LogPath`` file is recorded without calling ``docker logs``."""
+        log_path = tmp_path / "container-json.log"
+        log_path.touch()
+        docker_run.return_value = completed(f"{log_path}\n")
+        collector = ContainerLogCollector(tmp_path / "run", compress_logs=False)
+
+        result = collector._collect_single_container_log("web-test")
+
+        assert result["success"]
+        assert [cmd[:2] for cmd in docker_commands(docker_run)] == [["docker", "inspect"]]
+        assert "# No log output captured" in (collector.logs_dir / "web-test.log").read_text()
+
+    def test_empty_log_file_skips_api_logs(self, tmp_path):
+        """Test that the shortcut also avoids the API logs call when a client is configured."""
+        log_path = tmp_path / "container-json.log"
+        log_path.touch()
+        client = Mock()
+        client.inspect_container.return_value = {"LogPath": str(log_path)}
+        collector = ContainerLogCollector(tmp_path / "run", compress_logs=False, docker_client=client)
+
+        assert collector._collect_single_container_log("web-test")["success"]
+        client.logs.assert_not_called()
+
+    @pytest.mark.parametrize("log_path", ["", "missing/container-json.log"])
+    def test_unknown_log_file_falls_back_to_docker_logs(self, tmp_path, docker_run: Mock, log_path: str):
+        """Test that an empty or unreadable ``.LogPath`` still reads the logs."""
+        if log_path:
+            log_path = str(tmp_path / log_path)
+        docker_run.side_effect = [completed(f"{log_path}\n"), completed("2024-01-01T00:00:00Z ready\n")]
+        collector = ContainerLogCollector(tmp_path / "run", compress_logs=False)
+
+        result = collector._collect_single_container_log("web-test")
+
+        assert result["success"]
+        assert docker_commands(docker_run)[1][:2] == ["docker", "logs"]
+        assert "ready" in (collector.logs_dir / "web-test.log").read_text()
@@ -0,0 +1,229 @@
+"""Unit tests for performance metric aggregation.
+
+These tests exercise the pure-Python aggregation in the performance collector
+using synthetic Docker events, so they do not require a Docker daemon.
+"""
+
+import json
+
+import pytest
+
+from unified.performance.event_monitor import ContainerEvent, ContainerEventMonitor
+from unified.performance.health_watcher import HealthStatus
+from unified.performance.json_io import dumps
+from unified.performance.performance_collector import (
+    ContainerPerformanceMetrics,
+    EnvironmentPerformanceMetrics,
+    PerformanceCollector,
+)
+
+BASE_TIME_NS = 1_700_000_000 * 1_000_000_000
+
+
+def make_event(action: str, name: str, offset: float, health_status: str = "") -> ContainerEvent:
+    """Build a container event ``offset`` seconds after the base time."""
+    attributes = {"name": name, "image": "localhost/unified/test:latest"}
+    if health_status:
+        attributes["health_status"] = health_status
+    return ContainerEvent(
+        {
+            "Type": "container",
+            "Action": action,
+            "id": f"{name}-id",
+            "Actor": {"Attributes": attributes},
+            "timeNano": BASE_TIME_NS + int(offset * 1_000_000_000),
+        }
+    )
+
+
+def lifecycle_events(name: str, healthy_at: float) -> list:
+    """Build a full create → healthy → destroy lifecycle for a container."""
+    return [
+        make_event("create", name, 0.0),
+        make_event("start", name, 1.0),
+        make_event("health_status", name, 1.5, "starting"),
+        make_event("health_status", name, healthy_at, "healthy"),
+        make_event("stop", name, 20.0),
+        make_event("destroy", name, 22.0),
+    ]
+
+
+class TestContainerPerformanceMetrics:
+    """Test per-container metric derivation."""
+
+    def test_bulk_events_match_incremental_events(self):
+        """Test that bulk ingestion produces the same metrics as one-at-a-time ingestion."""
+        events = lifecycle_events("web-test", healthy_at=5.0)
+
+        incremental = ContainerPerformanceMetrics("web-test")
+        for event in events:
+            incremental.add_event(event)
+
+        bulk = ContainerPerformanceMetrics("web-test")
+        bulk.add_events(events)
+
+        assert bulk.to_dict() == incremental.to_dict()
+        assert bulk.metrics["startup_duration"] == 4.0
+        assert bulk.metrics["health_check_duration"] == 3.5
+        assert bulk.metrics["total_startup_time"] == 5.0
+        assert bulk.metrics["shutdown_duration"] == 2.0
+        assert bulk.image == "localhost/unified/test:latest"
+
+    def test_to_dict_is_cached_until_new_event(self):
+        """Test that serialization is reused until the container receives new data."""
+        metrics = ContainerPerformanceMetrics("web-test")
+        metrics.add_events(lifecycle_events("web-test", healthy_at=5.0)[:4])
+
+        first = metrics.to_dict()
+        cached = metrics._dict_cache
+        assert metrics.to_dict() == first
+        assert metrics._dict_cache is cached
+
+        metrics.add_event(make_event("stop", "web-test", 20.0))
+        second = metrics.to_dict()
+        assert metrics._dict_cache is not cached
+        assert second["event_count"] == 5
+
+    def test_to_dict_result_can_be_modified(self):
+        """Test that changing a returned dictionary does not leak into later calls."""
+        metrics = ContainerPerformanceMetrics("web-test")
+        metrics.add_events(lifecycle_events("web-test", healthy_at=5.0))
+
+        first = metrics.to_dict()
+        first["event_count"] = 0
+        first["metrics"]["startup_duration"] = None
+
+        second = metrics.to_dict()
+        assert second["event_count"] == 6
+        assert second["metrics"]["startup_duration"] == 4.0
+
+    def test_event_history_is_bounded(self):
+        """Test that raw events are capped while the event count keeps growing."""
+        metrics = ContainerPerformanceMetrics("web-test")
+        metrics.add_events([make_event("restart", "web-test", float(i)) for i in range(metrics.EVENT_CAP + 10)])
+
+        assert len(metrics.events) == metrics.EVENT_CAP
+        assert metrics.to_dict()["event_count"] == metrics.EVENT_CAP + 10
+        assert metrics.metrics["restart_count"] == metrics.EVENT_CAP + 10
+
+    def test_health_statuses_count_failures(self):
+        """Test that unhealthy health records are counted as failures."""
+        metrics = ContainerPerformanceMetrics("db-test")
+        metrics.add_health_statuses(
+            [
+                HealthStatus("db-test", HealthStatus.STARTING),
+                HealthStatus("db-test", HealthStatus.UNHEALTHY),
+                HealthStatus("db-test", HealthStatus.HEALTHY),
+            ]
+        )
+
+        assert metrics.metrics["health_check_failures"] == 1
+        assert metrics.to_dict()["health_record_count"] == 3
+
+
+class TestEnvironmentPerformanceMetrics:
+    """Test environment-level aggregation."""
+
+    def test_slowest_and_fastest_containers(self):
+        """Test environment aggregates across several containers."""
+        env = EnvironmentPerformanceMetrics("test-env")
+        env.add_container("web-test").add_events(lifecycle_events("web-test", healthy_at=5.0))
+        env.add_container("db-test").add_events(lifecycle_events("db-test", healthy_at=9.0))
+        env.add_container("dns-test").add_events(lifecycle_events("dns-test", healthy_at=3.0))
+
+        env.calculate_environment_metrics()
+
+        assert env.environment_metrics["container_count"] == 3
+        assert env.environment_metrics["slowest_container"] == "db-test"
+        assert env.environment_metrics["fastest_container"] == "dns-test"
+        assert env.environment_metrics["total_startup_time"] == 8.0
+        assert env.environment_metrics["average_startup_time"] == pytest.approx(14.0 / 3)
+        assert env.environment_metrics["total_shutdown_time"] == 2.0
+
+    def test_environment_metrics_follow_container_updates(self):
+        """Test that new container data is reflected after recalculation."""
+        env = EnvironmentPerformanceMetrics("test-env")
+        env.add_container("web-test").add_events(lifecycle_events("web-test", healthy_at=5.0))
+        env.calculate_environment_metrics()
+        assert env.environment_metrics["slowest_container"] == "web-test"
+
+        env.add_container("db-test").add_events(lifecycle_events("db-test", healthy_at=9.0))
+        env.calculate_environment_metrics()
+
+        assert env.environment_metrics["container_count"] == 2
+        assert env.environment_metrics["slowest_container"] == "db-test"
+        assert env.environment_metrics["total_startup_time"] == 8.0
+
+    def test_health_check_failure_rate(self):
+        """Test the failure rate across health records of all containers."""
+        env = EnvironmentPerformanceMetrics("test-env")
+        env.add_container("web-test").add_health_statuses(
+            [HealthStatus("web-test", HealthStatus.UNHEALTHY), HealthStatus("web-test", HealthStatus.HEALTHY)]
+        )
+        env.add_container("db-test").add_health_status(HealthStatus("db-test", HealthStatus.HEALTHY))
+        env.add_container("dns-test").add_health_status(HealthStatus("dns-test", HealthStatus.HEALTHY))
+
+        env.calculate_environment_metrics()
+
+        assert env.environment_metrics["health_check_failure_rate"] == 0.25
+
+
+class TestPerformanceCollector:
+    """Test collection from monitors."""
+
+    def test_repeated_collection_only_adds_new_events(self, tmp_path):
+        """Test that collecting twice from the same monitor does not double count events."""
+        collector = PerformanceCollector(tmp_path)
+        monitor = ContainerEventMonitor()
+        events = lifecycle_events("web-test", healthy_at=5.0)
+
+        monitor.events.extend(events[:4])
+        collector.collect_from_event_monitor(monitor, "test-env")
+        monitor.events.extend(events[4:])
+        collector.collect_from_event_monitor(monitor, "test-env")
+
+        container = collector.environments["test-env"].containers["web-test"]
+        assert container.event_count == len(events)
+        assert container.metrics["shutdown_duration"] == 2.0
+
+    def test_collection_restarts_after_monitor_is_cleared(self, tmp_path):
+        """Test that events recorded after the monitor was cleared are collected."""
+        collector = PerformanceCollector(tmp_path)
+        monitor = ContainerEventMonitor()
+
+        monitor.events.extend(lifecycle_events("web-test", healthy_at=5.0))
+        collector.collect_from_event_monitor(monitor, "test-env")
+        monitor.clear_events()
+        monitor.events.append(make_event("create", "db-test", 30.0))
+        collector.collect_from_event_monitor(monitor, "test-env")
+
+        assert collector.environments["test-env"].containers["db-test"].event_count == 1
+
+    def test_save_to_other_directory(self, tmp_path):
+        """Test that saving elsewhere leaves the collector's output directory unchanged."""
+        collector = PerformanceCollector(tmp_path)
+        run_dir = tmp_path / "run"
+        run_dir.mkdir()
+
+        output_path = collector.save_performance_data("performance-metrics.json", output_dir=run_dir)
+
+        assert output_path == run_dir / "performance-metrics.json"
+        assert output_path.exists()
+        assert collector.output_dir == tmp_path
+
+    def test_streamed_save_matches_full_dump(self, tmp_path):
+        """Test that streaming the file gives the same text as dumping the whole document at once."""
+        collector = PerformanceCollector(tmp_path)
+        monitor = ContainerEventMonitor()
+        monitor.events.extend(lifecycle_events("web-ü", healthy_at=5.0))
+        collector.collect_from_event_monitor(monitor, "test-env")
+
+        output_path = collector.save_performance_data("performance-metrics.json")
+
+        text = output_path.read_text(encoding="utf-8")
+        document = {
+            "timestamp": json.loads(text)["timestamp"],
+            "environments": {name: env.to_dict() for name, env in collector.environments.items()},
+            "baselines": collector.baselines,
+        }
+        assert text == dumps(document, pretty=True).decode()
@@ -0,0 +1,323 @@
+"""Unit tests for performance test runner helpers.
+
+These tests use a throwaway project directory and never start containers, so
+they do not require a Docker daemon.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from unified.performance.json_io import append_json_line
+from unified.performance.test_runner import PerformanceTestRunner, _mma
+
+COMPOSE_CONFIG = """\
+services:
+  volume-setup:
+    image: alpine
+  postgres:
+    image: postgres
+  apache:
+    image: httpd
+"""
+
+
+@pytest.fixture
+def runner(tmp_path: Path) -> PerformanceTestRunner:
+    """Create a runner for a project with a single ``perf`` environment."""
+    env_dir = tmp_path / "environments" / "perf"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env.perf").write_text("ENVIRONMENT=perf\n")
+    (env_dir / "docker-compose.perf.yml").write_text(COMPOSE_CONFIG)
+
+    return PerformanceTestRunner(tmp_path, output_dir=tmp_path / "performance_data")
+
+
+class TestEnvironmentConfigCache:
+    """Test reuse of parsed environment configuration."""
+
+    def test_config_is_reused_while_files_are_unchanged(self, runner: PerformanceTestRunner):
+        """Test that repeated loads return the cached configuration."""
+        first = runner._load_environment_config("perf")
+
+        assert runner._load_environment_config("perf") is first
+        assert set(first["compose_config"]["services"]) == {"volume-setup", "postgres", "apache"}
+
+    def test_config_is_reloaded_after_file_change(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that a modified compose file invalidates the cache."""
+        first = runner._load_environment_config("perf")
+
+        compose_file = tmp_path / "environments" / "perf" / "docker-compose.perf.yml"
+        compose_file.write_text(COMPOSE_CONFIG + "  dns:\n    image: bind9\n")
+        stat = compose_file.stat()
+        os.utime(compose_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = runner._load_environment_config("perf")
+
+        assert second is not first
+        assert "dns" in second["compose_config"]["services"]
+
+
+class TestEnvironmentListCache:
+    """Test reuse of the environments directory scan."""
+
+    def test_new_environment_invalidates_cache(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that environments added after a scan are picked up."""
+        manager = runner.environment_manager
+        assert manager.list_environments() == ["perf"]
+
+        env_dir = tmp_path / "environments" / "staging"
+        env_dir.mkdir()
+        assert manager.list_environments() == ["perf"]
+
+        (env_dir / ".env.staging").write_text("ENVIRONMENT=staging\n")
+        stat = env_dir.stat()
+        os.utime(env_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.list_environments() == ["perf", "staging"]
+
+
+class TestContainerClassification:
+    """Test deriving container names from the compose services."""
+
+    def test_one_time_containers_are_not_persistent(self, runner: PerformanceTestRunner):
+        """Test that one-time services are expected but not waited on for health."""
+        env_config = runner._load_environment_config("perf")
+
+        expected, persistent = runner._classify_containers(env_config, "perf")
+
+        assert expected == ["volume-setup-perf", "postgres-perf", "apache-perf"]
+        assert persistent == ["postgres-perf", "apache-perf"]
+
+    def test_names_are_reused_for_the_same_config(self, runner: PerformanceTestRunner):
+        """Test that repeated classification reuses the names but hands out fresh lists."""
+        env_config = runner._load_environment_config("perf")
+
+        first_expected, _ = runner._classify_containers(env_config, "perf")
+        first_expected.append("mutated")
+        second_expected, _ = runner._classify_containers(env_config, "perf")
+
+        assert second_expected == ["volume-setup-perf", "postgres-perf", "apache-perf"]
+        assert runner._container_names_cache["perf"][0] is env_config
+
+
+class TestCalculateTestSummary:
+    """Test summary statistics across iterations."""
+
+    def test_summary_statistics(self, runner: PerformanceTestRunner):
+        """Test startup, shutdown and per-container statistics over successful iterations."""
+        results = [
+            {"startup_success": True, "startup_time": 4.0, "shutdown_time": 1.0, "healthy_times": {"web": 2.0}},
+            {"startup_success": True, "startup_time": 6.0, "shutdown_time": 3.0, "healthy_times": {"web": 4.0}},
+            {"startup_success": False, "startup_time": 0, "shutdown_time": 0, "healthy_times": {}},
+        ]
+
+        summary = runner._calculate_test_summary(results)
+
+        assert summary["successful_iterations"] == 2
+        assert summary["success_rate"] == pytest.approx(2 / 3)
+        assert summary["startup_times"] == {
+            "min": 4.0,
+            "max": 6.0,
+            "average": 5.0,
+            "p50": 5.0,
+            "p95": pytest.approx(5.9),
+            "p99": pytest.approx(5.98),
+            "values": [4.0, 6.0],
+        }
+        assert summary["shutdown_times"]["average"] == 2.0
+        assert summary["container_healthy_times"]["web"] == {
+            "min": 2.0,
+            "max": 4.0,
+            "average": 3.0,
+            "p50": 3.0,
+            "p95": pytest.approx(3.9),
+            "p99": pytest.approx(3.98),
+            "values": [2.0, 4.0],
+        }
+
+    def test_values_can_be_omitted(self, runner: PerformanceTestRunner):
+        """Test that raw timings are dropped when summary values are disabled."""
+        runner.configure_test(summary_values=False)
+
+        summary = runner._calculate_test_summary([{"startup_success": True, "startup_time": 4.0}])
+
+        assert summary["startup_times"] == {"min": 4.0, "max": 4.0, "average": 4.0, "p50": 4.0, "p95": 4.0, "p99": 4.0}
+
+    def test_percentiles_interpolate_between_samples(self, runner: PerformanceTestRunner):
+        """Test that percentiles interpolate over sorted samples regardless of input order."""
+        results = [{"startup_success": True, "startup_time": float(t)} for t in (5, 1, 4, 2, 3)]
+
+        startup_times = runner._calculate_test_summary(results)["startup_times"]
+
+        assert startup_times["p50"] == 3.0
+        assert startup_times["p95"] == pytest.approx(4.8)
+
+
+class TestMinMaxMean:
+    """Test the single-pass min/max/mean reduction."""
+
+    def test_unordered_values(self):
+        """Test that extremes are found regardless of position."""
+        assert _mma([3.0, 1.0, 4.0, 1.5, 5.0]) == (1.0, 5.0, pytest.approx(2.9))
+
+    def test_single_value(self):
+        """Test that a single value is its own min, max and mean."""
+        assert _mma([2.5]) == (2.5, 2.5, 2.5)
+
+
+class TestCalculateOverallSummary:
+    """Test the summary across environments."""
+
+    def test_slowest_and_fastest_environments(self, runner: PerformanceTestRunner):
+        """Test that extremes are picked from the per-environment average startup times."""
+        environment_results = {
+            "dev": {"summary": {"startup_times": {"average": 5.0}}},
+            "staging": {"summary": {"startup_times": {"average": 9.0}}},
+            "test": {"summary": {"startup_times": {"average": 2.0}}},
+            "broken": {"error": "Environment not found"},
+        }
+
+        summary = runner._calculate_overall_summary(environment_results)
+
+        assert summary["successful_environments"] == 3
+        assert summary["failed_environments"] == 1
+        assert summary["slowest_environment"] == {"name": "staging", "startup_time": 9.0}
+        assert summary["fastest_environment"] == {"name": "test", "startup_time": 2.0}
+
+    def test_zero_average_is_kept(self, runner: PerformanceTestRunner):
+        """Test that a 0.0 average startup time is not dropped as missing."""
+        environment_results = {
+            "dev": {"summary": {"startup_times": {"average": 0.0}}},
+            "empty": {"summary": {}},
+        }
+
+        summary = runner._calculate_overall_summary(environment_results)
+
+        assert summary["average_startup_times"] == {"dev": 0.0}
+
+
+class TestWaitForCooldown:
+    """Test waiting for an environment's containers to disappear."""
+
+    def test_returns_once_containers_are_gone(self, runner: PerformanceTestRunner):
+        """Test that the wait ends on the first empty listing instead of the full cooldown."""
+        runner.docker_client = Mock()
+        runner.docker_client.containers.side_effect = [[{"Id": "abc"}], []]
+        runner.configure_test(cooldown_time=10)
+
+        runner._wait_for_cooldown("perf")
+
+        assert runner.docker_client.containers.call_count == 2
+
+    def test_gives_up_at_cooldown_time(self, runner: PerformanceTestRunner):
+        """Test that lingering containers do not extend the wait past the cooldown."""
+        runner.docker_client = Mock()
+        runner.docker_client.containers.return_value = [{"Id": "abc"}]
+        runner.configure_test(cooldown_time=0.05)
+
+        runner._wait_for_cooldown("perf")
+
+        assert runner.docker_client.containers.called
+
+
+class TestSaveResults:
+    """Test writing results to disk."""
+
+    def test_datetimes_are_written_as_iso_strings(self, runner: PerformanceTestRunner):
+        """Test that nested datetimes round-trip as ISO 8601 strings."""
+        started = datetime(2024, 1, 1, 12, 30, 0, 123456)
+        results = {"environment": "perf", "iterations": [{"start_time": started, "startup_time": 1.5}]}
+
+        results_file = runner.save_results(results)
+
+        saved = json.loads(results_file.read_text())
+        assert saved["iterations"] == [{"start_time": started.isoformat(), "startup_time": 1.5}]
+
+    def test_paths_are_written_as_strings(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that path values do not break serialization."""
+        results_file = runner.save_results({"environment": "perf", "log_file": tmp_path / "web.log"})
+
+        assert json.loads(results_file.read_text())["log_file"] == str(tmp_path / "web.log")
+
+    def test_output_is_compact_unless_pretty(self, runner: PerformanceTestRunner):
+        """Test that indentation is only added when pretty JSON is configured."""
+        compact_file = runner.save_results({"environment": "perf"}, "compact.json")
+        runner.configure_test(pretty_json=True)
+        pretty_file = runner.save_results({"environment": "perf"}, "pretty.json")
+
+        assert "\n" not in compact_file.read_text()
+        assert pretty_file.read_text().startswith("{\n  ")
+
+    def test_no_temporary_file_is_left_behind(self, runner: PerformanceTestRunner):
+        """Test that the atomic write moves the temporary file into place."""
+        results_file = runner.save_results({"environment": "perf"}, "atomic.json")
+
+        assert json.loads(results_file.read_text()) == {"environment": "perf"}
+        assert not results_file.with_name("atomic.json.tmp").exists()
+
+    def test_iterations_are_appended_as_json_lines(self, tmp_path: Path):
+        """Test that each appended iteration is one parseable line."""
+        iterations_file = tmp_path / "iterations.ndjson"
+        append_json_line(iterations_file, {"iteration": "warmup", "start_time": datetime(2024, 1, 1)})
+        append_json_line(iterations_file, {"iteration": "iteration_1", "startup_time": 2.5})
+
+        lines = [json.loads(line) for line in iterations_file.read_text().splitlines()]
+        assert lines == [
+            {"iteration": "warmup", "start_time": "2024-01-01T00:00:00"},
+            {"iteration": "iteration_1", "startup_time": 2.5},
+        ]
+
+    def test_metadata_lists_run_files(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that a run directory gets metadata naming the results and metrics files."""
+        runner.current_run_dir = tmp_path / "run"
+        runner.current_run_dir.mkdir()
+
+        runner.save_results({"environment": "perf"}, "results.json")
+
+        metadata = json.loads((runner.current_run_dir / "test-metadata.json").read_text())
+        assert metadata["environment"] == "perf"
+        assert metadata["files"]["test_results"] == "results.json"
+        assert (runner.current_run_dir / metadata["files"]["performance_metrics"]).exists()
+
+
+class TestBackgroundIO:
+    """Test background file writes."""
+
+    def test_pending_writes_are_joined(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that queued writes finish on join and failures do not propagate."""
+        target = tmp_path / "written.txt"
+
+        def fail() -> None:
+            raise OSError("disk full")
+
+        runner._submit_io(target.write_text, "done")
+        runner._submit_io(fail)
+        runner._wait_for_pending_io()
+
+        assert target.read_text() == "done"
+        assert runner._pending_io == []
+
+    def test_exit_finishes_writes_and_shuts_down_pool(self, runner: PerformanceTestRunner, tmp_path: Path):
+        """Test that leaving the context waits for queued writes and releases the pool."""
+        target = tmp_path / "written.txt"
+
+        with runner:
+            runner._submit_io(target.write_text, "done")
+
+        assert target.read_text() == "done"
+        with pytest.raises(RuntimeError):
+            runner._submit_io(target.write_text, "late")
+
+    def test_results_can_be_saved_after_exit(self, runner: PerformanceTestRunner):
+        """Test that save_results does not depend on the runner's background pool."""
+        with runner:
+            pass
+
+        results_file = runner.save_results({"environment": "perf"}, "after-exit.json")
+
+        assert json.loads(results_file.read_text()) == {"environment": "perf"}
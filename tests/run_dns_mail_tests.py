@@ -74,6 +74,27 @@ class DNSMailTestRunner:
             logger.warning(f"Error resolving mail server IP: {e}")
             os.environ["MAIL_SERVER_IP"] = "192.168.0.156"
 
+    def run_plugin_tests(self) -> Dict[str, Any]:
+        """Run the DNS mail pytest plugin tests, which stub DNS and need no server."""
+        logger.info("Running DNS mail plugin tests...")
+
+        pytest_args = [
+            "-v",
+            "--tb=short",
+            "--confcutdir=tests",
+            "tests/test_dns_mail_fixtures.py",
+            "-p",
+            "conftest_dns_mail",
+            "-p",
+            "pytester",
+            "-p",
+            "no:warnings",
+        ]
+
+        result = pytest.main(pytest_args)
+
+        return {"test_type": "plugin", "exit_code": result, "passed": result == 0, "timestamp": time.time()}
+
     def run_basic_tests(self) -> Dict[str, Any]:
         """Run basic DNS mail tests."""
         logger.info("Running basic DNS mail tests...")
@@ -150,6 +171,10 @@ class DNSMailTestRunner:
 
         self.start_time = time.time()
 
+        # Run plugin tests
+        plugin_results = self.run_plugin_tests()
+        self.test_results["plugin"] = plugin_results
+
         # Run basic tests
         basic_results = self.run_basic_tests()
         self.test_results["basic"] = basic_results
@@ -0,0 +1,194 @@
+"""Tests for the DNS and mail integration pytest plugin in conftest_dns_mail.py.
+
+DNS lookups and readiness probes are stubbed, so these tests do not require a DNS server.
+The plugin is not loaded for the whole suite, so these tests skip unless it and pytester
+are enabled, as ``run_dns_mail_tests.py`` does:
+
+    PYTHONPATH=tests pytest -p conftest_dns_mail -p pytester tests/test_dns_mail_fixtures.py
+"""
+
+import threading
+import time
+from typing import Any, Dict
+from unittest.mock import Mock
+
+import conftest_dns_mail
+import pytest
+
+# Load the plugin in the inner pytest runs; without the cache provider every run probes afresh
+PLUGIN_ARGS = ("-p", "conftest_dns_mail", "-p", "no:cacheprovider")
+
+
+@pytest.fixture(autouse=True)
+def require_plugins(request: pytest.FixtureRequest):
+    """Skip when the DNS mail plugin or pytester was not enabled with ``-p``."""
+    for plugin in ("conftest_dns_mail", "pytester"):
+        if not request.config.pluginmanager.has_plugin(plugin):
+            pytest.skip(f"run with -p {plugin} to test the DNS mail plugin")
+
+
+class TestPluginRegistration:
+    """Test that the plugin is loaded for the test suite."""
+
+    def test_no_dns_cache_option_is_registered(self, pytestconfig: pytest.Config):
+        """Test that the plugin's command line option is available."""
+        assert pytestconfig.getoption("no_dns_cache") is False
+
+
+class TestCollectionHooks:
+    """Test the probes run after collection."""
+
+    @pytest.fixture
+    def probes(self, monkeypatch: pytest.MonkeyPatch):
+        """Stub the UDP availability probe and the readiness check."""
+        responds = Mock(return_value=False)
+        check = Mock(return_value="DNS server not running - skipping DNS integration tests")
+        monkeypatch.setattr(conftest_dns_mail, "_dns_server_responds", responds)
+        monkeypatch.setattr(conftest_dns_mail, "check_services_running", check)
+        return responds, check
+
+    def test_unrelated_tests_do_not_probe(self, pytester: pytest.Pytester, probes):
+        """Test that no probe runs when no selected test needs DNS."""
+        responds, check = probes
+        pytester.makepyfile("def test_plain():\n    pass\n")
+
+        pytester.runpytest_inprocess(*PLUGIN_ARGS).assert_outcomes(passed=1)
+
+        responds.assert_not_called()
+        check.assert_not_called()
+
+    def test_marked_tests_are_skipped_without_dns(self, pytester: pytest.Pytester, probes):
+        """Test that DNS-marked tests are skipped when the server does not reply."""
+        responds, _ = probes
+        pytester.makepyfile(
+            "import pytest\n\n@pytest.mark.dns_integration\ndef test_dns():\n    pass\n\ndef test_plain():\n    pass\n"
+        )
+
+        pytester.runpytest_inprocess(*PLUGIN_ARGS).assert_outcomes(passed=1, skipped=1)
+
+        responds.assert_called_once()
+
+    def test_readiness_is_checked_once(self, pytester: pytest.Pytester, probes):
+        """Test that every test using the fixture shares one readiness check and its skip reason."""
+        _, check = probes
+        pytester.makepyfile(
+            "def test_a(ensure_services_running):\n    pass\n\ndef test_b(ensure_services_running):\n    pass\n"
+        )
+
+        result = pytester.runpytest_inprocess(*PLUGIN_ARGS, "-rs")
+
+        result.assert_outcomes(skipped=2)
+        result.stdout.fnmatch_lines(["*DNS server not running*"])
+        check.assert_called_once()
+
+    def test_deselected_tests_do_not_trigger_readiness_check(self, pytester: pytest.Pytester, probes):
+        """Test that tests narrowed away with -k do not cause a readiness check."""
+        _, check = probes
+        pytester.makepyfile("def test_dns(ensure_services_running):\n    pass\n\ndef test_plain():\n    pass\n")
+
+        pytester.runpytest_inprocess(*PLUGIN_ARGS, "-k", "plain").assert_outcomes(passed=1, deselected=1)
+
+        check.assert_not_called()
+
+    def test_ready_services_do_not_skip(self, pytester: pytest.Pytester, probes):
+        """Test that the fixture passes when the readiness check found no problem."""
+        _, check = probes
+        check.return_value = None
+        pytester.makepyfile("def test_dns(ensure_services_running):\n    assert ensure_services_running\n")
+
+        pytester.runpytest_inprocess(*PLUGIN_ARGS).assert_outcomes(passed=1)
+
+
+class TestLookupDns:
+    """Test how dnspython outcomes map to answers and lookup errors."""
+
+    @pytest.fixture
+    def resolver(self):
+        """Resolver stub handed to lookup_dns in place of a dnspython resolver."""
+        pytest.importorskip("dns.resolver")
+        return Mock()
+
+    @staticmethod
+    def _no_nameservers(error: object, response: object):
+        """Build the error dnspython raises once every nameserver has failed."""
+        import dns.resolver
+
+        return dns.resolver.NoNameservers(request=Mock(), errors=[("127.0.0.1", False, 53, error, response)])
+
+    def test_error_rcode_is_an_empty_answer(self, resolver: Mock):
+        """Test that a SERVFAIL or REFUSED reply counts as an answer, as it does with dig."""
+        resolver.resolve.side_effect = self._no_nameservers("SERVFAIL", Mock())
+
+        assert conftest_dns_mail.lookup_dns(conftest_dns_mail.load_dns_mail_config(), resolver, ".", "NS") == []
+
+    def test_transport_error_is_retryable(self, resolver: Mock):
+        """Test that a server that could not be reached raises a retryable error."""
+        resolver.resolve.side_effect = self._no_nameservers(ConnectionRefusedError(), None)
+
+        with pytest.raises(conftest_dns_mail.DNSLookupError) as excinfo:
+            conftest_dns_mail.lookup_dns(conftest_dns_mail.load_dns_mail_config(), resolver, ".", "NS")
+
+        assert excinfo.value.retryable
+
+
+class TestQueryDnsHedging:
+    """Test retries and hedged attempts in the dns_query_helper fixture."""
+
+    @pytest.fixture(autouse=True)
+    def fast_retries(self, monkeypatch: pytest.MonkeyPatch, dns_mail_config: Dict[str, Any]):
+        """Shorten the hedge and retry delays so the tests run quickly."""
+        monkeypatch.setattr(conftest_dns_mail, "DNS_HEDGE_DELAY", 0.05)
+        monkeypatch.setitem(dns_mail_config, "retry_delay", 0)
+
+    @pytest.fixture
+    def released(self):
+        """Event that unblocks slow stub lookups when the test finishes."""
+        event = threading.Event()
+        yield event
+        event.set()
+
+    def test_success_on_first_attempt(self, monkeypatch: pytest.MonkeyPatch, dns_query_helper):
+        """Test that a prompt answer is returned without further attempts."""
+        lookup = Mock(return_value=["192.0.2.1"])
+        monkeypatch.setattr(conftest_dns_mail, "lookup_dns", lookup)
+
+        assert dns_query_helper("success.example", "A") == (True, ["192.0.2.1"])
+        lookup.assert_called_once()
+
+    def test_slow_attempt_is_hedged(self, monkeypatch: pytest.MonkeyPatch, dns_query_helper, released):
+        """Test that a second attempt answers while the first is still waiting, query after query."""
+        calls = []
+
+        def lookup(config, resolver, domain, record_type, timeout):
+            calls.append(domain)
+            # The first attempt of each query hangs until the test ends
+            if calls.count(domain) == 1:
+                released.wait(5)
+                return ["slow"]
+            return ["fast"]
+
+        monkeypatch.setattr(conftest_dns_mail, "lookup_dns", lookup)
+
+        started = time.monotonic()
+        for domain in ("hedge-1.example", "hedge-2.example", "hedge-3.example"):
+            assert dns_query_helper(domain, "A") == (True, ["fast"])
+
+        assert time.monotonic() - started < 2
+
+    def test_permanent_failure_is_not_retried(self, monkeypatch: pytest.MonkeyPatch, dns_query_helper):
+        """Test that a non-retryable error ends the query after one attempt."""
+        lookup = Mock(side_effect=conftest_dns_mail.DNSLookupError("refused", retryable=False))
+        monkeypatch.setattr(conftest_dns_mail, "lookup_dns", lookup)
+
+        assert dns_query_helper("permanent.example", "A") == (False, [])
+        lookup.assert_called_once()
+
+    def test_all_attempts_time_out(
+        self, monkeypatch: pytest.MonkeyPatch, dns_query_helper, dns_mail_config: Dict[str, Any]
+    ):
+        """Test that every attempt is used before giving up on retryable errors."""
+        lookup = Mock(side_effect=conftest_dns_mail.DNSLookupError("timed out"))
+        monkeypatch.setattr(conftest_dns_mail, "lookup_dns", lookup)
+
+        assert dns_query_helper("timeout.example", "A") == (False, [])
+        assert lookup.call_count == dns_mail_config["retry_attempts"]